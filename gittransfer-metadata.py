@@ -11,22 +11,25 @@ This tool transfers GitLab repository metadata to GitHub, preserving:
 """
 
 import os
-import json
+import sys
 import tempfile
 import time
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Set, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, replace
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import quote_plus
 import hashlib
 import traceback
 
 import click
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 import gitlab
 from github import Github, Repository, Issue, PullRequest, Label, Milestone
-from github.GithubException import GithubException, RateLimitExceededException
+from github.GithubException import RateLimitExceededException, UnknownObjectException
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
 from rich.prompt import Prompt, Confirm
@@ -41,11 +44,40 @@ console = Console()
 RATE_LIMIT_BUFFER = 10  # Keep this many requests in reserve
 MAX_RETRY_ATTEMPTS = 3
 RETRY_DELAY_SECONDS = 2
+USER_LOOKUP_WORKERS = 10
+EXPORT_IO_WORKERS = 4
+NOTE_FETCH_WORKERS = 8  # Issues/MRs whose comments are fetched at once
+API_PAGE_SIZE = 100  # Largest page both APIs allow
+HTTP_POOL_MAXSIZE = 16  # Keep-alive connections per host, enough for the worker threads
 DEFAULT_EXPORT_DIR = "metadata_export"
+EXPORT_MANIFEST_FILE = "manifest.json"
+LEGACY_EXPORT_FILE = "metadata_export.json"
 RESUME_STATE_FILE = "transfer_state.json"
 
+# Slotted dataclasses (Python 3.10+) drop the per-instance __dict__
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass(frozen=True)
+
+def write_json(path: Path, data: Any) -> bytes:
+    """Serialize data (including dataclasses) to an indented JSON file"""
+    content = orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2)
+    path.write_bytes(content)
+    return content
+    
+    
+def write_jsonl(path: Path, items: List[Any]) -> bytes:
+    """Serialize items to a JSON Lines file, one record per line"""
+    content = b''.join(orjson.dumps(item, default=str) + b'\n' for item in items)
+    path.write_bytes(content)
+    return content
+    
+    
+def read_json(path: Path) -> Any:
+    """Load a JSON file"""
+    return orjson.loads(path.read_bytes())
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class UserMapping:
     """Maps GitLab users to GitHub users"""
     gitlab_username: str
@@ -56,7 +88,7 @@ class UserMapping:
     email: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, **DATACLASS_SLOTS)
 class TransferState:
     """Tracks transfer progress for resume capability"""
     gitlab_project_id: int
@@ -70,7 +102,7 @@ class TransferState:
     last_checkpoint: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, **DATACLASS_SLOTS)
 class IssueData:
     """Represents a GitLab issue with all metadata"""
     id: int
@@ -89,7 +121,7 @@ class IssueData:
     gitlab_url: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, **DATACLASS_SLOTS)
 class MergeRequestData:
     """Represents a GitLab merge request with all metadata"""
     id: int
@@ -144,6 +176,13 @@ class GitLabMetadataExtractor:
         self.user_cache[user_id] = mapping
         return mapping
         
+    def _list_notes(self, item) -> Tuple[Any, List[Any], Optional[Exception]]:
+        """Fetch the notes of an issue or MR, returning any error instead of raising it"""
+        try:
+            return item, item.notes.list(all=True), None
+        except Exception as e:
+            return item, [], e
+        
     def extract_issues(self) -> List[IssueData]:
         """Extract all issues from GitLab project"""
         issues = []
@@ -155,9 +194,9 @@ class GitLabMetadataExtractor:
             TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
             console=console
         ) as progress:
-            # Get total count
-            all_issues = self.project.issues.list(all=True, lazy=True)
-            total_issues = len(list(all_issues))
+            # Stream the issues once; the total comes from the first page's headers
+            all_issues = self.project.issues.list(iterator=True)
+            total_issues = all_issues.total
             
             if total_issues == 0:
                 console.print("ℹ️  No issues found in GitLab project")
@@ -165,60 +204,63 @@ class GitLabMetadataExtractor:
                 
             task = progress.add_task("Extracting GitLab issues...", total=total_issues)
             
-            # Re-fetch with full data
-            for issue in self.project.issues.list(all=True):
-                try:
-                    # Get author mapping
-                    author = self.get_user_mapping(issue.author['id'])
-                    
-                    # Get assignees
-                    assignees = []
-                    if hasattr(issue, 'assignees') and issue.assignees:
-                        assignees = [self.get_user_mapping(assignee['id']) for assignee in issue.assignees]
-                    elif hasattr(issue, 'assignee') and issue.assignee:
-                        assignees = [self.get_user_mapping(issue.assignee['id'])]
-                    
-                    # Get comments/notes
-                    comments = []
+            # Comments take a request per issue, so fetch them concurrently and process in order
+            with ThreadPoolExecutor(max_workers=NOTE_FETCH_WORKERS) as executor:
+                for issue, notes, notes_error in executor.map(self._list_notes, all_issues):
                     try:
-                        for note in issue.notes.list(all=True):
-                            if not note.system:  # Skip system notes
-                                comment_author = self.get_user_mapping(note.author['id'])
-                                comments.append({
-                                    'id': note.id,
-                                    'body': note.body,
-                                    'created_at': note.created_at,
-                                    'updated_at': note.updated_at,
-                                    'author': asdict(comment_author),
-                                    'gitlab_url': f"{self.project.web_url}/-/issues/{issue.iid}#note_{note.id}"
-                                })
+                        # Get author mapping
+                        author = self.get_user_mapping(issue.author['id'])
+                        
+                        # Get assignees
+                        assignees = []
+                        if hasattr(issue, 'assignees') and issue.assignees:
+                            assignees = [self.get_user_mapping(assignee['id']) for assignee in issue.assignees]
+                        elif hasattr(issue, 'assignee') and issue.assignee:
+                            assignees = [self.get_user_mapping(issue.assignee['id'])]
+                        
+                        # Get comments/notes
+                        comments = []
+                        try:
+                            if notes_error:
+                                raise notes_error
+                            for note in notes:
+                                if not note.system:  # Skip system notes
+                                    comment_author = self.get_user_mapping(note.author['id'])
+                                    comments.append({
+                                        'id': note.id,
+                                        'body': note.body,
+                                        'created_at': note.created_at,
+                                        'updated_at': note.updated_at,
+                                        'author': asdict(comment_author),
+                                        'gitlab_url': f"{self.project.web_url}/-/issues/{issue.iid}#note_{note.id}"
+                                    })
+                        except Exception as e:
+                            console.print(f"⚠️  Could not fetch comments for issue #{issue.iid}: {e}", style="yellow")
+                        
+                        issue_data = IssueData(
+                            id=issue.id,
+                            iid=issue.iid,
+                            title=issue.title,
+                            description=issue.description or "",
+                            state=issue.state,
+                            created_at=issue.created_at,
+                            updated_at=issue.updated_at,
+                            closed_at=issue.closed_at,
+                            author=author,
+                            assignees=assignees,
+                            labels=issue.labels,
+                            milestone=issue.milestone['title'] if issue.milestone else None,
+                            comments=comments,
+                            gitlab_url=f"{self.project.web_url}/-/issues/{issue.iid}"
+                        )
+                        
+                        issues.append(issue_data)
+                        progress.update(task, advance=1)
+                        
                     except Exception as e:
-                        console.print(f"⚠️  Could not fetch comments for issue #{issue.iid}: {e}", style="yellow")
-                    
-                    issue_data = IssueData(
-                        id=issue.id,
-                        iid=issue.iid,
-                        title=issue.title,
-                        description=issue.description or "",
-                        state=issue.state,
-                        created_at=issue.created_at,
-                        updated_at=issue.updated_at,
-                        closed_at=issue.closed_at,
-                        author=author,
-                        assignees=assignees,
-                        labels=issue.labels,
-                        milestone=issue.milestone['title'] if issue.milestone else None,
-                        comments=comments,
-                        gitlab_url=f"{self.project.web_url}/-/issues/{issue.iid}"
-                    )
-                    
-                    issues.append(issue_data)
-                    progress.update(task, advance=1)
-                    
-                except Exception as e:
-                    console.print(f"❌ Failed to extract issue #{issue.iid}: {e}", style="red")
-                    progress.update(task, advance=1)
-                    continue
+                        console.print(f"❌ Failed to extract issue #{issue.iid}: {e}", style="red")
+                        progress.update(task, advance=1)
+                        continue
                     
         console.print(f"✅ Extracted {len(issues)} issues from GitLab", style="green")
         return issues
@@ -234,9 +276,9 @@ class GitLabMetadataExtractor:
             TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
             console=console
         ) as progress:
-            # Get all MRs (we'll filter to closed ones later)
-            all_mrs = self.project.mergerequests.list(all=True, lazy=True)
-            total_mrs = len(list(all_mrs))
+            # Stream all MRs once (we'll filter to closed ones later)
+            all_mrs = self.project.mergerequests.list(iterator=True)
+            total_mrs = all_mrs.total
             
             if total_mrs == 0:
                 console.print("ℹ️  No merge requests found in GitLab project")
@@ -244,67 +286,75 @@ class GitLabMetadataExtractor:
                 
             task = progress.add_task("Extracting GitLab merge requests...", total=total_mrs)
             
-            # Re-fetch with full data
-            for mr in self.project.mergerequests.list(all=True):
-                try:
-                    # Only process closed/merged MRs (open ones can't be recreated in GitHub)
-                    if mr.state not in ['closed', 'merged']:
+            def list_mr_notes(mr):
+                # Open MRs are skipped below, so don't fetch their comments
+                if mr.state not in ['closed', 'merged']:
+                    return mr, [], None
+                return self._list_notes(mr)
+                
+            with ThreadPoolExecutor(max_workers=NOTE_FETCH_WORKERS) as executor:
+                for mr, notes, notes_error in executor.map(list_mr_notes, all_mrs):
+                    try:
+                        # Only process closed/merged MRs (open ones can't be recreated in GitHub)
+                        if mr.state not in ['closed', 'merged']:
+                            progress.update(task, advance=1)
+                            continue
+                            
+                        # Get author mapping
+                        author = self.get_user_mapping(mr.author['id'])
+                        
+                        # Get assignee
+                        assignee = None
+                        if hasattr(mr, 'assignee') and mr.assignee:
+                            assignee = self.get_user_mapping(mr.assignee['id'])
+                        
+                        # Get comments/notes
+                        comments = []
+                        try:
+                            if notes_error:
+                                raise notes_error
+                            for note in notes:
+                                if not note.system:  # Skip system notes
+                                    comment_author = self.get_user_mapping(note.author['id'])
+                                    comments.append({
+                                        'id': note.id,
+                                        'body': note.body,
+                                        'created_at': note.created_at,
+                                        'updated_at': note.updated_at,
+                                        'author': asdict(comment_author),
+                                        'gitlab_url': f"{self.project.web_url}/-/merge_requests/{mr.iid}#note_{note.id}"
+                                    })
+                        except Exception as e:
+                            console.print(f"⚠️  Could not fetch comments for MR !{mr.iid}: {e}", style="yellow")
+                        
+                        mr_data = MergeRequestData(
+                            id=mr.id,
+                            iid=mr.iid,
+                            title=mr.title,
+                            description=mr.description or "",
+                            state=mr.state,
+                            created_at=mr.created_at,
+                            updated_at=mr.updated_at,
+                            closed_at=mr.closed_at,
+                            merged_at=mr.merged_at,
+                            author=author,
+                            assignee=assignee,
+                            labels=mr.labels,
+                            milestone=mr.milestone['title'] if mr.milestone else None,
+                            source_branch=mr.source_branch,
+                            target_branch=mr.target_branch,
+                            comments=comments,
+                            gitlab_url=f"{self.project.web_url}/-/merge_requests/{mr.iid}",
+                            sha=getattr(mr, 'sha', None)
+                        )
+                        
+                        merge_requests.append(mr_data)
                         progress.update(task, advance=1)
-                        continue
                         
-                    # Get author mapping
-                    author = self.get_user_mapping(mr.author['id'])
-                    
-                    # Get assignee
-                    assignee = None
-                    if hasattr(mr, 'assignee') and mr.assignee:
-                        assignee = self.get_user_mapping(mr.assignee['id'])
-                    
-                    # Get comments/notes
-                    comments = []
-                    try:
-                        for note in mr.notes.list(all=True):
-                            if not note.system:  # Skip system notes
-                                comment_author = self.get_user_mapping(note.author['id'])
-                                comments.append({
-                                    'id': note.id,
-                                    'body': note.body,
-                                    'created_at': note.created_at,
-                                    'updated_at': note.updated_at,
-                                    'author': asdict(comment_author),
-                                    'gitlab_url': f"{self.project.web_url}/-/merge_requests/{mr.iid}#note_{note.id}"
-                                })
                     except Exception as e:
-                        console.print(f"⚠️  Could not fetch comments for MR !{mr.iid}: {e}", style="yellow")
-                    
-                    mr_data = MergeRequestData(
-                        id=mr.id,
-                        iid=mr.iid,
-                        title=mr.title,
-                        description=mr.description or "",
-                        state=mr.state,
-                        created_at=mr.created_at,
-                        updated_at=mr.updated_at,
-                        closed_at=mr.closed_at,
-                        merged_at=mr.merged_at,
-                        author=author,
-                        assignee=assignee,
-                        labels=mr.labels,
-                        milestone=mr.milestone['title'] if mr.milestone else None,
-                        source_branch=mr.source_branch,
-                        target_branch=mr.target_branch,
-                        comments=comments,
-                        gitlab_url=f"{self.project.web_url}/-/merge_requests/{mr.iid}",
-                        sha=getattr(mr, 'sha', None)
-                    )
-                    
-                    merge_requests.append(mr_data)
-                    progress.update(task, advance=1)
-                    
-                except Exception as e:
-                    console.print(f"❌ Failed to extract MR !{mr.iid}: {e}", style="red")
-                    progress.update(task, advance=1)
-                    continue
+                        console.print(f"❌ Failed to extract MR !{mr.iid}: {e}", style="red")
+                        progress.update(task, advance=1)
+                        continue
                     
         console.print(f"✅ Extracted {len(merge_requests)} closed/merged MRs from GitLab", style="green")
         return merge_requests
@@ -355,9 +405,9 @@ class GitHubMetadataImporter:
     def check_rate_limit(self) -> bool:
         """Check GitHub rate limit and wait if necessary"""
         try:
-            rate_limit = self.github.get_rate_limit()
-            remaining = rate_limit.core.remaining
-            reset_time = rate_limit.core.reset
+            # Read from the last response's rate-limit headers; get_rate_limit() would cost a request per call
+            remaining, _ = self.github.rate_limiting
+            reset_time = datetime.fromtimestamp(self.github.rate_limiting_resettime, timezone.utc)
             
             if remaining < RATE_LIMIT_BUFFER:
                 if not self.rate_limit_warned:
@@ -369,7 +419,6 @@ class GitHubMetadataImporter:
                     console.print(f"🕐 Rate limit exceeded. Waiting {wait_time:.0f} seconds...", style="yellow")
                     time.sleep(max(wait_time, 0))
                     self.rate_limit_warned = False
-                    return self.check_rate_limit()
                     
             return True
         except Exception as e:
@@ -399,8 +448,11 @@ class GitHubMetadataImporter:
                     
     def resolve_github_username(self, user_mapping: UserMapping) -> str:
         """Resolve GitLab user to GitHub username or fallback"""
-        if user_mapping.github_username:
-            return f"@{user_mapping.github_username}"
+        # Exported authors only carry GitLab details; the GitHub username comes from user_mapping.json
+        mapping = self.user_mappings.get(user_mapping.gitlab_username, user_mapping)
+        # A github_id of 0 marks a username that doesn't exist on GitHub, so it isn't @mentioned
+        if mapping.github_username and mapping.github_id != 0:
+            return f"@{mapping.github_username}"
         elif user_mapping.fallback_name:
             return user_mapping.fallback_name
         else:
@@ -427,29 +479,30 @@ class GitHubMetadataImporter:
         ) as progress:
             task = progress.add_task("Importing labels to GitHub...", total=len(labels))
             
+            # List existing labels once instead of looking each one up (names are case-insensitive)
+            existing_labels = {
+                label.name.lower(): label
+                for label in self.retry_with_backoff(lambda: list(self.repo.get_labels()))
+            }
+            
             for label_data in labels:
                 try:
                     # Check if label already exists
-                    try:
-                        existing_label = self.retry_with_backoff(
-                            self.repo.get_label, 
-                            label_data['name']
-                        )
+                    existing_label = existing_labels.get(label_data['name'].lower())
+                    if existing_label:
                         imported_labels[label_data['name']] = existing_label
                         console.print(f"   ✅ Label '{label_data['name']}' already exists")
-                    except GithubException as e:
-                        if e.status == 404:
-                            # Create new label
-                            new_label = self.retry_with_backoff(
-                                self.repo.create_label,
-                                name=label_data['name'],
-                                color=label_data['color'],
-                                description=label_data['description'][:100] if label_data['description'] else ""
-                            )
-                            imported_labels[label_data['name']] = new_label
-                            console.print(f"   ✅ Created label '{label_data['name']}'")
-                        else:
-                            raise
+                    else:
+                        # Create new label
+                        new_label = self.retry_with_backoff(
+                            self.repo.create_label,
+                            name=label_data['name'],
+                            color=label_data['color'],
+                            description=label_data['description'][:100] if label_data['description'] else ""
+                        )
+                        imported_labels[label_data['name']] = new_label
+                        existing_labels[label_data['name'].lower()] = new_label
+                        console.print(f"   ✅ Created label '{label_data['name']}'")
                             
                     progress.update(task, advance=1)
                     
@@ -474,15 +527,16 @@ class GitHubMetadataImporter:
         ) as progress:
             task = progress.add_task("Importing milestones to GitHub...", total=len(milestones))
             
+            # List existing milestones once instead of once per imported milestone
+            existing_milestones = {
+                ms.title: ms
+                for ms in self.retry_with_backoff(lambda: list(self.repo.get_milestones(state='all')))
+            }
+            
             for milestone_data in milestones:
                 try:
                     # Check if milestone already exists
-                    existing_milestone = None
-                    for ms in self.retry_with_backoff(self.repo.get_milestones, state='all'):
-                        if ms.title == milestone_data['title']:
-                            existing_milestone = ms
-                            break
-                            
+                    existing_milestone = existing_milestones.get(milestone_data['title'])
                     if existing_milestone:
                         imported_milestones[milestone_data['title']] = existing_milestone
                         console.print(f"   ✅ Milestone '{milestone_data['title']}' already exists")
@@ -503,6 +557,7 @@ class GitHubMetadataImporter:
                             state='closed' if milestone_data['state'] == 'closed' else 'open'
                         )
                         imported_milestones[milestone_data['title']] = new_milestone
+                        existing_milestones[milestone_data['title']] = new_milestone
                         console.print(f"   ✅ Created milestone '{milestone_data['title']}'")
                         
                     progress.update(task, advance=1)
@@ -618,10 +673,18 @@ class MetadataTransferTool:
         self.transfer_state = None
         self.user_mappings = {}
         
+        # Keep-alive session for GitLab, sized so concurrent requests don't open throwaway connections
+        self._gitlab_session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=HTTP_POOL_MAXSIZE)
+        self._gitlab_session.mount('https://', adapter)
+        self._gitlab_session.mount('http://', adapter)
+        
     def setup_gitlab_client(self, gitlab_url: str, token: str) -> bool:
         """Initialize GitLab client with comprehensive error handling"""
         try:
-            self.gitlab_client = gitlab.Gitlab(gitlab_url, private_token=token)
+            # python-gitlab waits out 429s itself; also retry transient 5xx errors
+            self.gitlab_client = gitlab.Gitlab(gitlab_url, private_token=token, per_page=API_PAGE_SIZE,
+                                               retry_transient_errors=True, session=self._gitlab_session)
             self.gitlab_client.auth()
             
             # Get user info to verify token works
@@ -647,7 +710,7 @@ class MetadataTransferTool:
     def setup_github_client(self, token: str) -> bool:
         """Initialize GitHub client"""
         try:
-            self.github_client = Github(token)
+            self.github_client = Github(token, per_page=API_PAGE_SIZE, pool_size=HTTP_POOL_MAXSIZE)
             user = self.github_client.get_user()
             console.print(f"✅ GitHub authentication successful (User: {user.login})", style="green")
             return True
@@ -771,9 +834,9 @@ class MetadataTransferTool:
             self.display_detailed_validation_results(validation_results)
             return False
             
-        # Compare repository names (allowing for case differences)
-        gitlab_name = self.gitlab_project.name.lower()
-        github_name = self.github_repo.name.lower()
+        # Compare repository names (allowing for case and separator differences)
+        gitlab_name = self.gitlab_project.name.strip().lower().replace('_', '-')
+        github_name = self.github_repo.name.strip().lower().replace('_', '-')
         name_match = gitlab_name == github_name or github_name in gitlab_name or gitlab_name in github_name
         
         if name_match:
@@ -856,16 +919,10 @@ class MetadataTransferTool:
             
             # Check issues access
             try:
-                issues_list = list(self.gitlab_project.issues.list(per_page=1, all=False))
-                # Get more accurate count by checking if there are more
-                if issues_list:
-                    try:
-                        all_issues = list(self.gitlab_project.issues.list(all=True, lazy=True))
-                        issues_count = len(all_issues)
-                    except:
-                        issues_count = "1+"
-                else:
-                    issues_count = 0
+                # One single-item page; the count comes from its headers
+                issues_page = self.gitlab_project.issues.list(per_page=1, iterator=True)
+                # GitLab omits the total for very large lists
+                issues_count = issues_page.total if issues_page.total is not None else "1+"
             except Exception as e:
                 issues_error = str(e)
                 if "403" in str(e) or "Forbidden" in str(e):
@@ -877,15 +934,8 @@ class MetadataTransferTool:
             
             # Check merge requests access
             try:
-                mrs_list = list(self.gitlab_project.mergerequests.list(per_page=1, all=False))
-                if mrs_list:
-                    try:
-                        all_mrs = list(self.gitlab_project.mergerequests.list(all=True, lazy=True))
-                        mrs_count = len(all_mrs)
-                    except:
-                        mrs_count = "1+"
-                else:
-                    mrs_count = 0
+                mrs_page = self.gitlab_project.mergerequests.list(per_page=1, iterator=True)
+                mrs_count = mrs_page.total if mrs_page.total is not None else "1+"
             except Exception as e:
                 mrs_error = str(e)
                 if "403" in str(e) or "Forbidden" in str(e):
@@ -961,8 +1011,7 @@ class MetadataTransferTool:
             }
             
         try:
-            with open(mapping_file, 'w') as f:
-                json.dump(user_mapping_data, f, indent=2, default=str)
+            write_json(mapping_file, user_mapping_data)
                 
             console.print(f"📝 Created user mapping file: {mapping_file}", style="blue")
             console.print("   Please edit this file to map GitLab users to GitHub users", style="blue")
@@ -980,8 +1029,7 @@ class MetadataTransferTool:
             return False
             
         try:
-            with open(mapping_file, 'r') as f:
-                mapping_data = json.load(f)
+            mapping_data = read_json(mapping_file)
                 
             self.user_mappings = {}
             for gitlab_username, data in mapping_data.items():
@@ -1000,6 +1048,55 @@ class MetadataTransferTool:
         except Exception as e:
             console.print(f"❌ Failed to load user mappings: {e}", style="red")
             return False
+
+    def save_user_mappings(self) -> bool:
+        """Write current user mappings back to file"""
+        mapping_file = self.export_dir / "user_mapping.json"
+        
+        try:
+            write_json(mapping_file, self.user_mappings)
+            return True
+        except Exception as e:
+            console.print(f"⚠️  Could not update user mapping file: {e}", style="yellow")
+            return False
+            
+    def resolve_github_user_ids(self):
+        """Check mapped GitHub usernames in one concurrent pass, dropping ones that don't exist"""
+        # Users resolved on an earlier run already have their ID saved in the mapping file
+        pending = [(key, m) for key, m in self.user_mappings.items() if m.github_username and not m.github_id]
+        if not pending:
+            return
+            
+        console.print(f"🔍 Resolving {len(pending)} GitHub user{'s' if len(pending) != 1 else ''}...")
+        
+        def lookup(mapping: UserMapping) -> Optional[int]:
+            try:
+                return self.github_client.get_user(mapping.github_username).id
+            except UnknownObjectException:
+                # 0 marks a username that doesn't exist on GitHub
+                return 0
+            except Exception as e:
+                console.print(f"⚠️  Could not resolve GitHub user '{mapping.github_username}': {e}", style="yellow")
+                return None
+                
+        with ThreadPoolExecutor(max_workers=USER_LOOKUP_WORKERS) as executor:
+            github_ids = list(executor.map(lookup, [m for _, m in pending]))
+            
+        resolved = 0
+        for (key, mapping), github_id in zip(pending, github_ids):
+            if github_id:
+                self.user_mappings[key] = replace(mapping, github_id=github_id)
+                resolved += 1
+        if resolved:
+            self.save_user_mappings()
+            
+        # Unknown usernames are marked after saving, so the file keeps them for correction
+        for (key, mapping), github_id in zip(pending, github_ids):
+            if github_id == 0:
+                console.print(f"⚠️  GitHub user '{mapping.github_username}' does not exist; "
+                              f"{mapping.gitlab_username} will be credited by name", style="yellow")
+                self.user_mappings[key] = replace(mapping, github_id=0)
+        console.print(f"✅ Resolved {resolved} of {len(pending)} GitHub users", style="green")
             
     def export_metadata(self) -> bool:
         """Export GitLab metadata to local files"""
@@ -1032,27 +1129,29 @@ class MetadataTransferTool:
                 for comment in mr.comments:
                     all_users.add(UserMapping(**comment['author']))
             
-            # Export to JSON files
-            export_data = {
-                'project_info': {
+            # Export each section to its own file
+            fragments = {
+                'project_info': ('project_info.json', {
                     'gitlab_id': self.gitlab_project.id,
                     'gitlab_name': self.gitlab_project.name,
                     'gitlab_url': self.gitlab_project.web_url,
                     'github_repo': self.github_repo.full_name if self.github_repo else None,
                     'export_timestamp': datetime.now().isoformat()
-                },
-                'issues': [asdict(issue) for issue in issues],
-                'merge_requests': [asdict(mr) for mr in merge_requests],
-                'labels': labels,
-                'milestones': milestones
+                }),
+                'labels': ('labels.json', labels),
+                'milestones': ('milestones.json', milestones),
+                'issues': ('issues.jsonl', issues),
+                'merge_requests': ('merge_requests.jsonl', merge_requests)
             }
             
-            # Save main export file
-            export_file = self.export_dir / "metadata_export.json"
-            with open(export_file, 'w') as f:
-                json.dump(export_data, f, indent=2, default=str)
+            with ThreadPoolExecutor(max_workers=EXPORT_IO_WORKERS) as executor:
+                manifest = dict(zip(fragments, executor.map(self._write_export_fragment, fragments.values())))
                 
-            console.print(f"✅ Exported metadata to {export_file}", style="green")
+            # Save manifest listing all export files
+            manifest_file = self.export_dir / EXPORT_MANIFEST_FILE
+            write_json(manifest_file, manifest)
+                
+            console.print(f"✅ Exported metadata to {self.export_dir} (manifest: {manifest_file.name})", style="green")
             
             # Create user mapping file
             self.create_user_mapping_file(all_users)
@@ -1067,6 +1166,41 @@ class MetadataTransferTool:
             traceback.print_exc()
             return False
             
+    def _write_export_fragment(self, fragment: Tuple[str, Any]) -> Dict[str, Any]:
+        """Write one export file and return its manifest entry"""
+        file_name, data = fragment
+        path = self.export_dir / file_name
+        if file_name.endswith('.jsonl'):
+            content = write_jsonl(path, data)
+        else:
+            content = write_json(path, data)
+            
+        return {
+            'file': file_name,
+            'sha256': hashlib.sha256(content).hexdigest(),
+            'count': len(data) if isinstance(data, list) else 1
+        }
+        
+    def _read_export_fragment(self, entry: Dict[str, Any]) -> Any:
+        """Read one export file listed in the manifest and verify its checksum"""
+        content = (self.export_dir / entry['file']).read_bytes()
+        if hashlib.sha256(content).hexdigest() != entry['sha256']:
+            raise ValueError(f"Checksum mismatch for {entry['file']}")
+            
+        if entry['file'].endswith('.jsonl'):
+            return [orjson.loads(line) for line in content.splitlines() if line]
+        return orjson.loads(content)
+        
+    def load_export_data(self) -> Dict[str, Any]:
+        """Load exported metadata from the manifest, or from a legacy single-file export"""
+        manifest_file = self.export_dir / EXPORT_MANIFEST_FILE
+        if not manifest_file.exists():
+            return read_json(self.export_dir / LEGACY_EXPORT_FILE)
+            
+        manifest = read_json(manifest_file)
+        with ThreadPoolExecutor(max_workers=EXPORT_IO_WORKERS) as executor:
+            return dict(zip(manifest, executor.map(self._read_export_fragment, manifest.values())))
+            
     def create_export_summary(self, issues_count: int, mrs_count: int, 
                             labels_count: int, milestones_count: int, users_count: int):
         """Create export summary report"""
@@ -1091,7 +1225,9 @@ Next Steps:
 3. Verify the transfer results
 
 Files Created:
-- metadata_export.json (main export data)
+- manifest.json (list of export files with checksums)
+- project_info.json, labels.json, milestones.json (export data)
+- issues.jsonl, merge_requests.jsonl (one record per line)
 - user_mapping.json (user mappings - edit this!)
 - export_summary.txt (this file)
 """
@@ -1108,18 +1244,19 @@ Files Created:
         console.print("📥 Importing metadata to GitHub...")
         
         # Load exported metadata
-        export_file = self.export_dir / "metadata_export.json"
-        if not export_file.exists():
+        export_file = self.export_dir / EXPORT_MANIFEST_FILE
+        if not export_file.exists() and not (self.export_dir / LEGACY_EXPORT_FILE).exists():
             console.print(f"❌ Export file not found: {export_file}", style="red")
             return False
             
         # Load user mappings
         if not self.load_user_mappings():
             console.print("⚠️  Continuing without user mappings", style="yellow")
+        else:
+            self.resolve_github_user_ids()
             
         try:
-            with open(export_file, 'r') as f:
-                export_data = json.load(f)
+            export_data = self.load_export_data()
                 
             # Convert back to data classes
             issues = []
@@ -1387,7 +1524,7 @@ def main(dry_run):
         console.print(f"\n❌ {action} failed. Please check the errors above.", style="red")
         if dry_run:
             console.print("\n💡 Fix the issues above before attempting the actual transfer.", style="blue")
-        exit(1)
+        sys.exit(1)
     elif dry_run:
         console.print("\n🎯 To perform the actual transfer, run the command again without --dry-run", style="blue")
 
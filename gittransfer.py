@@ -10,35 +10,424 @@ This tool transfers a complete GitLab repository to GitHub, preserving:
 """
 
 import os
+import io
+import sys
+import signal
+import re
+import base64
+import hashlib
+import json
+import copy
+import itertools
+import subprocess
 import tempfile
+import threading
 import shutil
+import stat
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Set, Tuple, TYPE_CHECKING
 import click
-import git
-import gitlab
-from github import Github, Repository
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.prompt import Prompt, Confirm
-from rich.panel import Panel
-from rich.table import Table
+
+# gitlab, github and the rest of rich are imported where they are used, which keeps
+# startup fast for --help and for runs that fail before reaching the APIs
+if TYPE_CHECKING:
+    from github import Repository
 
 console = Console()
 
+# Connection pool sizing for the shared HTTP session
+HTTP_POOL_CONNECTIONS = 8
+HTTP_POOL_MAXSIZE = 16
+# Seconds git gets to exit after Ctrl-C before it is killed
+GIT_TERMINATE_TIMEOUT = 5
+# Redraw rate for progress bars
+PROGRESS_REFRESH_PER_SECOND = 10
+# A git progress line, e.g. "Receiving objects:  45% (450/1000), 1.20 MiB | 2.40 MiB/s"
+GIT_PROGRESS_LINE = re.compile(r'^(?P<phase>.+?):\s+\d+%\s+\((?P<done>\d+)/(?P<total>\d+)\)(?P<detail>.*)$')
+# Timeout in seconds for API requests made directly on the session
+API_TIMEOUT = 30
+# Timeout in seconds for the reachability check made while tokens are typed
+PROBE_TIMEOUT = 10
+# Retries with exponential backoff for rate-limited or temporarily unavailable APIs. python-gitlab
+# also waits out a 429 the session gives up on (up to 10 times), so a GitLab call that stays
+# rate-limited is sent at most (API_RETRIES + 1) * 11 times; 5xx errors are retried only here.
+API_RETRIES = 6
+API_RETRY_BACKOFF = 2
+API_RETRY_STATUSES = (429, 502, 503, 504)
+
+# GitHub REST API root, connected to in the background while the remaining prompts are answered
+GITHUB_API_URL = "https://api.github.com"
+# GitHub GraphQL endpoint and the queries used to validate the target repository
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+GITHUB_ORG_REPO_QUERY = """
+query($org: String!, $name: String!) {
+  organization(login: $org) {
+    viewerIsAMember
+    viewerCanCreateRepositories
+    repository(name: $name) { nameWithOwner }
+  }
+}
+"""
+GITHUB_VIEWER_REPO_QUERY = """
+query($name: String!) {
+  viewer {
+    repository(name: $name) { nameWithOwner }
+  }
+}
+"""
+
+# GitLab GraphQL query for branch names, which returns up to GITLAB_BRANCH_PAGE names per request
+GITLAB_BRANCH_PAGE = 1000
+GITLAB_BRANCH_NAMES_QUERY = """
+query($path: ID!, $offset: Int!, $limit: Int!) {
+  project(fullPath: $path) {
+    repository { branchNames(searchPattern: "*", offset: $offset, limit: $limit) }
+  }
+}
+"""
+
+# Delta search limits for --repack (git's defaults are 10 and 50)
+REPACK_WINDOW = 250
+REPACK_DEPTH = 50
+
+# Repositories transferred at once with --repos-file
+DEFAULT_PARALLEL_TRANSFERS = 4
+
+# Bare repositories kept between runs by --object-cache
+OBJECT_CACHE_DIR = Path.home() / ".cache" / "gittransfer"
+# API responses kept between runs by --http-cache and revalidated with their ETag
+HTTP_CACHE_DIR = OBJECT_CACHE_DIR / "http"
+
+
+class ETagCacheAdapter(HTTPAdapter):
+    """HTTP adapter that stores GET responses on disk and revalidates them with If-None-Match."""
+    
+    def __init__(self, cache_dir: Path, **kwargs):
+        super().__init__(**kwargs)
+        self.cache_dir = cache_dir
+        
+    def _cache_path(self, request: requests.PreparedRequest) -> Path:
+        """Cache file for a request; credentials are part of the key so tokens never share entries."""
+        credentials = request.headers.get('PRIVATE-TOKEN', '') + request.headers.get('Authorization', '')
+        key = hashlib.sha256(f"{request.url}\0{credentials}".encode()).hexdigest()
+        return self.cache_dir / f"{key}.json"
+        
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        if request.method != 'GET' or kwargs.get('stream'):
+            return super().send(request, **kwargs)
+            
+        path = self._cache_path(request)
+        try:
+            cached = json.loads(path.read_bytes())
+            request.headers['If-None-Match'] = cached['etag']
+        except (OSError, ValueError, KeyError):
+            cached = None
+            
+        response = super().send(request, **kwargs)
+        if cached and response.status_code == 304:
+            # Unchanged: answer from the cache as if the server had sent the full response
+            response.status_code = 200
+            response.reason = 'OK'
+            response.headers.update(cached['headers'])
+            response._content = base64.b64decode(cached['content'])
+        elif response.status_code == 200 and response.headers.get('ETag'):
+            # The body is stored decoded, so drop headers that describe the wire encoding
+            headers = {name: value for name, value in response.headers.items()
+                       if name.lower() not in ('content-encoding', 'content-length', 'transfer-encoding')}
+            entry = {
+                'etag': response.headers['ETag'],
+                'headers': headers,
+                'content': base64.b64encode(response.content).decode()
+            }
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                # Write beside the entry and rename so concurrent readers never see a partial file
+                with tempfile.NamedTemporaryFile('w', dir=str(self.cache_dir), delete=False) as tmp:
+                    json.dump(entry, tmp)
+                os.replace(tmp.name, str(path))
+            except OSError:
+                pass
+        return response
+
+
+@dataclass(frozen=True)
+class TransferConfig:
+    """A GitLab project to transfer and an optional new name on GitHub."""
+    gitlab_project_url: str
+    new_repo_name: Optional[str] = None
+
+
+def read_repos_file(lines) -> List[TransferConfig]:
+    """Parse a repository list: one project per line, optionally followed by a new name."""
+    repos = []
+    for line in lines:
+        fields = line.split('#', 1)[0].split()
+        if fields:
+            repos.append(TransferConfig(fields[0], fields[1] if len(fields) > 1 else None))
+    return repos
+
+
+def create_session(http_cache: bool = False) -> requests.Session:
+    """Create the keep-alive session shared by all API calls."""
+    session = requests.Session()
+    # Retry-After is honoured; after the last retry the response is returned so callers report it.
+    # POST is retried too: on this session it only carries read-only GraphQL queries.
+    retry = Retry(total=API_RETRIES, backoff_factor=API_RETRY_BACKOFF, status_forcelist=API_RETRY_STATUSES,
+                  allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {'POST'},
+                  respect_retry_after_header=True, raise_on_status=False)
+    pool_options = dict(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE, max_retries=retry)
+    if http_cache:
+        adapter = ETagCacheAdapter(HTTP_CACHE_DIR, **pool_options)
+    else:
+        adapter = HTTPAdapter(**pool_options)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def probe_gitlab(gitlab_url: str) -> Optional[str]:
+    """Check that a GitLab instance answers, returning an error message if it doesn't."""
+    try:
+        # Newer GitLab wants a token for /version, but a 401 still proves the URL points at GitLab
+        response = requests.get(f"{gitlab_url.rstrip('/')}/api/v4/version", timeout=PROBE_TIMEOUT)
+        if response.status_code == 404:
+            return "no GitLab API found at this address"
+        return None
+    except requests.RequestException as e:
+        return str(e)
+
+
+def prewarm_connection(session: requests.Session, url: str):
+    """Open a pooled connection to a host so the first API call skips the TCP and TLS handshakes."""
+    try:
+        session.head(url, timeout=PROBE_TIMEOUT)
+    except requests.RequestException:
+        pass
+
 
 class GitTransfer:
-    def __init__(self, dry_run: bool = False):
+    def __init__(self, dry_run: bool = False, filter_blobs: bool = False, object_cache: bool = False,
+                 temp_root: Optional[str] = None, show_progress: bool = True, http_cache: bool = False,
+                 verify_clone: bool = False, repack: bool = False, tag: Optional[str] = None,
+                 session: Optional[requests.Session] = None):
         self.gitlab_client = None
         self.github_client = None
+        self.github_user = None
         self.temp_dir = None
-        self.repo_clone = None
         self.dry_run = dry_run
+        self.filter_blobs = filter_blobs
+        self.object_cache = object_cache
+        # Parent directory for the temporary clone (system default when None)
+        self.temp_root = temp_root
+        # Live progress bars can't be shared between concurrent transfers
+        self.show_progress = show_progress
+        # Dry run only: clone the history (without file contents) and check it
+        self.verify_clone = verify_clone
+        # Recompress the clone before pushing, trading local CPU for upload size
+        self.repack = repack
+        # Only copy this tag to a repository that already exists on GitHub
+        self.tag = tag
+        self._credentials: Dict[str, str] = {}
+        # Extra git config passed through the environment (never argv or .git/config)
+        self._git_config: Dict[str, str] = {
+            # index-pack only uses some of the cores unless a thread count is set explicitly
+            'pack.threads': str(os.cpu_count() or 1),
+            # Protocol v2 lets the server skip advertising every ref (default only from git 2.26)
+            'protocol.version': '2',
+        }
+        # Projects already looked up, keyed by (project URL, with statistics)
+        self._gitlab_projects: Dict[Tuple[str, bool], Any] = {}
+        # GitHub organizations already fetched, keyed by login
+        self._github_orgs: Dict[str, Any] = {}
+        # Running git processes, shared with forks so an interrupt can stop all of them
+        self._git_processes: Set[subprocess.Popen] = set()
+        # Set on Ctrl-C; also shared with forks so parallel transfers stop at their next step
+        self._cancelled = threading.Event()
+        
+        # One keep-alive session shared by all API calls
+        self._session = session or create_session(http_cache)
             
-    def setup_gitlab_client(self, gitlab_url: str, token: str):
+    def _add_git_http_auth(self, url: str, username: str, token: str):
+        """Send token credentials as an HTTP header to the host of the given URL."""
+        parts = urllib.parse.urlsplit(url)
+        credentials = base64.b64encode(f"{username}:{token}".encode()).decode()
+        self._git_config[f"http.{parts.scheme}://{parts.netloc}/.extraheader"] = f"Authorization: Basic {credentials}"
+        
+    def _git_env(self) -> Dict[str, str]:
+        """Build the environment for git commands, including extra config."""
+        env = os.environ.copy()
+        env['GIT_TERMINAL_PROMPT'] = '0'
+        if self._git_config:
+            params = ' '.join(
+                "'" + f"{key}={value}".replace("'", "'\\''") + "'"
+                for key, value in self._git_config.items()
+            )
+            existing = env.get('GIT_CONFIG_PARAMETERS')
+            env['GIT_CONFIG_PARAMETERS'] = f"{existing} {params}" if existing else params
+        return env
+        
+    def _run_git(self, args: List[str], description: str, git_dir: Optional[str] = None,
+                 check: bool = True) -> subprocess.CompletedProcess:
+        """Run a git command, showing its --progress output as progress bars."""
+        from rich.progress import Progress, TextColumn, BarColumn, MofNCompleteColumn, TimeElapsedColumn
+        
+        command = ['git', '--git-dir', git_dir] if git_dir else ['git']
+        console.print(description)
+        
+        progress = Progress(
+            TextColumn("   {task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            TextColumn("{task.fields[detail]}"),
+            TimeElapsedColumn(),
+            console=console,
+            refresh_per_second=PROGRESS_REFRESH_PER_SECOND,
+            disable=not self.show_progress
+        )
+        # stdout goes to a file so a long report can't block git while stderr is being read
+        with tempfile.TemporaryFile() as stdout, progress:
+            if self._cancelled.is_set():
+                raise RuntimeError("transfer cancelled")
+            process = subprocess.Popen(
+                command + args,
+                stdout=stdout,
+                stderr=subprocess.PIPE,
+                env=self._git_env(),
+                # Its own process group, so an interrupt can stop git's helpers (remote-https, index-pack) too
+                start_new_session=os.name == 'posix'
+            )
+            self._git_processes.add(process)
+            try:
+                # Ctrl-C may have arrived between the check above and registering the process
+                if self._cancelled.is_set():
+                    self._stop_git(process)
+                phases: Dict[str, Any] = {}
+                last_line = ""
+                # newline='' splits on the '\r' git uses to redraw a progress line in place
+                for line in io.TextIOWrapper(process.stderr, encoding='utf-8', errors='replace', newline=''):
+                    text = line.strip()
+                    if not text:
+                        continue
+                    last_line = text
+                    
+                    match = GIT_PROGRESS_LINE.match(text)
+                    if not match:
+                        progress.console.print(f"   {text}", markup=False, highlight=False, emoji=False)
+                        continue
+                        
+                    # One bar per phase (counting, compressing, receiving, resolving deltas, ...)
+                    phase = match.group('phase')
+                    if phase not in phases:
+                        phases[phase] = progress.add_task(phase, total=None, detail="")
+                    detail = match.group('detail').strip(' ,')
+                    if detail.endswith('done.'):
+                        detail = detail[:-len('done.')].rstrip(' ,')
+                    progress.update(phases[phase], total=int(match.group('total')),
+                                    completed=int(match.group('done')), detail=detail)
+                process.wait()
+            finally:
+                # Reached early only on an exception; don't leave git running in its own session
+                if process.poll() is None:
+                    self._stop_git(process, kill=True)
+                    process.wait()
+                self._git_processes.discard(process)
+            stdout.seek(0)
+            output = stdout.read().decode('utf-8', errors='replace')
+            
+        if check and process.returncode != 0:
+            raise RuntimeError(f"git {args[0]} failed: {last_line}")
+        return subprocess.CompletedProcess(command + args, process.returncode, output, last_line)
+        
+    @staticmethod
+    def _stop_git(process: subprocess.Popen, kill: bool = False):
+        """Terminate (or kill) a git process together with the helpers it started."""
+        if os.name == 'posix':
+            try:
+                os.killpg(process.pid, signal.SIGKILL if kill else signal.SIGTERM)
+            except OSError:
+                # Already exited
+                pass
+        elif kill:
+            process.kill()
+        else:
+            process.terminate()
+            
+    def _on_sigint(self, signum, frame):
+        """Stop running git processes on Ctrl-C so temporary clones are cleaned up right away."""
+        self._cancelled.set()
+        processes = list(self._git_processes)
+        for process in processes:
+            self._stop_git(process)
+        # Wait for git to exit before the temporary clones are removed, or it may still be writing to them
+        for process in processes:
+            try:
+                process.wait(timeout=GIT_TERMINATE_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                self._stop_git(process, kill=True)
+                process.wait()
+        raise KeyboardInterrupt
+        
+    @staticmethod
+    def _rejected_refs(porcelain: str) -> List[Tuple[str, str]]:
+        """Extract (ref, reason) pairs for rejected refs from git push --porcelain output."""
+        rejected = []
+        for line in porcelain.splitlines():
+            fields = line.split('\t')
+            if len(fields) >= 3 and fields[0] == '!':
+                rejected.append((fields[1].split(':')[-1], fields[2]))
+        return rejected
+            
+    def _remove_temp_dir(self):
+        """Delete the temporary clone directory (in the background on POSIX)."""
+        if os.name == 'posix':
+            # rm -rf unlinks large trees much faster than a Python-level walk. It runs detached
+            # in its own session, so neither the transfer nor the exit waits for it.
+            subprocess.Popen(
+                ['rm', '-rf', self.temp_dir],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True
+            )
+        else:
+            def make_writable(func, path, exc_info):
+                # git marks object files read-only, which blocks deletion on Windows
+                os.chmod(path, stat.S_IWRITE)
+                func(path)
+            shutil.rmtree(self.temp_dir, onerror=make_writable)
+            
+    def _count_refs(self, namespace: str) -> int:
+        """Count refs under a namespace (e.g. refs/heads) in the cloned repository."""
+        result = subprocess.run(
+            ['git', '--git-dir', self.temp_dir, 'for-each-ref', '--format=%(refname)', namespace],
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        return len(result.stdout.splitlines())
+            
+    def setup_gitlab_client(self, gitlab_url: str, token: str, verify: bool = True):
         """Initialize GitLab client with custom URL and token."""
         try:
-            self.gitlab_client = gitlab.Gitlab(gitlab_url, private_token=token)
+            import gitlab
+            
+            # The session already retries 5xx errors, so python-gitlab must not retry them as well
+            self.gitlab_client = gitlab.Gitlab(gitlab_url, private_token=token, session=self._session,
+                                               retry_transient_errors=False)
+            self._credentials['gitlab'] = token
+            
+            if not verify:
+                # The project lookup that follows fails loudly on a bad token
+                console.print("✅ GitLab client configured", style="green")
+                return True
+                
             self.gitlab_client.auth()
             
             # Get user info to verify token works
@@ -64,16 +453,36 @@ class GitTransfer:
     def setup_github_client(self, token: str):
         """Initialize GitHub client with token."""
         try:
-            self.github_client = Github(token)
-            user = self.github_client.get_user()
-            console.print(f"✅ GitHub authentication successful (User: {user.login})", style="green")
+            from github import Github
+            from github.GithubRetry import GithubRetry
+            
+            # GithubRetry also waits out primary and secondary rate limits reported with 403
+            retry = GithubRetry(total=API_RETRIES, backoff_factor=API_RETRY_BACKOFF)
+            self.github_client = Github(token, pool_size=HTTP_POOL_MAXSIZE, retry=retry)
+            self._credentials['github'] = token
+            # Keep the authenticated user so later checks don't fetch it again
+            self.github_user = self.github_client.get_user()
+            console.print(f"✅ GitHub authentication successful (User: {self.github_user.login})", style="green")
             return True
         except Exception as e:
             console.print(f"❌ GitHub authentication failed: {str(e)}", style="red")
             return False
             
-    def get_gitlab_project(self, project_url: str) -> Optional[Any]:
-        """Get GitLab project from URL with multiple fallback strategies."""
+    def get_gitlab_project(self, project_url: str, statistics: bool = False) -> Optional[Any]:
+        """Get GitLab project from URL, reusing an earlier lookup when possible."""
+        # A project loaded with statistics also serves lookups that don't need them
+        for key in ((project_url, statistics), (project_url, True)):
+            if key in self._gitlab_projects:
+                return self._gitlab_projects[key]
+                
+        project = self._find_gitlab_project(project_url, statistics)
+        if project:
+            self._gitlab_projects[(project_url, statistics)] = project
+        return project
+        
+    def _find_gitlab_project(self, project_url: str, statistics: bool) -> Optional[Any]:
+        """Get GitLab project from URL, falling back to a search of your projects."""
+        # Repository statistics are costly for GitLab to compute; only the dry-run analysis needs them
         try:
             # Extract project path from URL
             if project_url.startswith('http'):
@@ -87,115 +496,158 @@ class GitTransfer:
                 
             console.print(f"🔍 Attempting to access project: {project_path}")
             
-            # Strategy 1: Try with URL encoding
+            # Direct lookup (python-gitlab URL-encodes the path)
             try:
-                import urllib.parse
-                encoded_path = urllib.parse.quote(project_path, safe='')
-                console.print(f"   Trying encoded path: {encoded_path}")
-                project = self.gitlab_client.projects.get(encoded_path)
+                project = self.gitlab_client.projects.get(project_path, statistics=statistics)
                 console.print(f"✅ Found GitLab project: {project.name}", style="green")
                 return project
             except Exception as e1:
-                console.print(f"   Encoded path failed: {str(e1)}", style="yellow")
-                
-            # Strategy 2: Try without encoding
-            try:
-                console.print(f"   Trying unencoded path: {project_path}")
-                project = self.gitlab_client.projects.get(project_path)
-                console.print(f"✅ Found GitLab project: {project.name}", style="green")
-                return project
-            except Exception as e2:
-                console.print(f"   Unencoded path failed: {str(e2)}", style="yellow")
+                console.print(f"   Direct lookup failed: {str(e1)}", style="yellow")
                 
-            # Strategy 3: Search for the project by name
+            # Fall back to a single pass over your projects, matched locally
             try:
-                project_name = project_path.split('/')[-1]
-                console.print(f"   Searching for project by name: {project_name}")
-                projects = self.gitlab_client.projects.list(search=project_name, all=True)
+                console.print("   Searching your accessible projects...")
+                wanted = project_path.lower()
+                project_suffix = '/'.join(wanted.split('/')[-2:])  # last 2 parts
+                project_name = wanted.split('/')[-1]
+                partial_match = None
+                suggestions = []
                 
-                if projects:
-                    console.print(f"   Found {len(projects)} projects matching '{project_name}':")
-                    for i, proj in enumerate(projects[:5]):  # Show first 5
-                        console.print(f"     {i+1}. {proj.path_with_namespace} (ID: {proj.id})")
+                accessible_projects = self.gitlab_client.projects.list(
+                    membership=True, statistics=statistics, iterator=True,
+                    per_page=100, pagination='keyset', order_by='id', sort='asc'
+                )
+                for proj in accessible_projects:
+                    path = proj.path_with_namespace.lower()
+                    if path == wanted:
+                        console.print(f"✅ Found exact match: {proj.name}", style="green")
+                        return proj
+                    if partial_match is None and (path == project_suffix or path.endswith('/' + project_suffix)):
+                        partial_match = proj
+                    if len(suggestions) < 10 and project_name in path:
+                        suggestions.append(proj.path_with_namespace)
+                        
+                if partial_match:
+                    console.print(f"✅ Found partial match: {partial_match.name} ({partial_match.path_with_namespace})", style="green")
+                    return partial_match
                     
-                    # Look for exact match
-                    for proj in projects:
-                        if proj.path_with_namespace == project_path:
-                            console.print(f"✅ Found exact match: {proj.name}", style="green")
-                            return proj
-                            
-                    # If no exact match, try the first one that ends with the same path
-                    project_suffix = '/'.join(project_path.split('/')[-2:])  # last 2 parts
-                    for proj in projects:
-                        if proj.path_with_namespace.endswith(project_suffix):
-                            console.print(f"✅ Found partial match: {proj.name} ({proj.path_with_namespace})", style="green")
-                            return proj
-                            
-            except Exception as e3:
-                console.print(f"   Search failed: {str(e3)}", style="yellow")
-                
-            # Strategy 4: List accessible projects to help user identify the correct path
-            try:
-                console.print("   Listing your accessible projects to help identify the correct path:")
-                accessible_projects = self.gitlab_client.projects.list(membership=True, per_page=20)
-                
-                if accessible_projects:
-                    console.print("   Your accessible projects:")
-                    for proj in accessible_projects:
-                        console.print(f"     • {proj.path_with_namespace}")
-                        if project_path.lower() in proj.path_with_namespace.lower():
-                            console.print(f"       ^ This might be the one you're looking for!", style="blue")
+                if suggestions:
+                    console.print("   Accessible projects with a similar path:")
+                    for path in suggestions:
+                        console.print(f"     • {path}")
                 else:
-                    console.print("   No accessible projects found. Check your token permissions.", style="yellow")
+                    console.print("   No similar accessible projects found. Check the path and your token permissions.", style="yellow")
                     
-            except Exception as e4:
-                console.print(f"   Could not list accessible projects: {str(e4)}", style="yellow")
+            except Exception as e2:
+                console.print(f"   Could not list accessible projects: {str(e2)}", style="yellow")
             
-            raise Exception(f"Could not access project using any strategy. Original error: 404 Project Not Found")
+            raise Exception(f"Could not find project '{project_path}'. Original error: 404 Project Not Found")
             
         except Exception as e:
             console.print(f"❌ Failed to access GitLab project: {str(e)}", style="red")
             return None
                 
+    def _ls_remote_refs(self, project: Any) -> Optional[Tuple[List[str], List[str]]]:
+        """List branch and tag names (newest version tags first) with git ls-remote."""
+        try:
+            clone_url = project.http_url_to_repo
+            self._add_git_http_auth(clone_url, 'oauth2', self._credentials['gitlab'])
+            result = self._run_git(
+                ['ls-remote', '--heads', '--tags', '--sort=-v:refname', clone_url],
+                "Listing branches and tags..."
+            )
+        except Exception as e:
+            console.print(f"   git ls-remote failed, using the API instead: {str(e)}", style="yellow")
+            return None
+            
+        branches, tags = [], []
+        for line in result.stdout.splitlines():
+            ref = line.split('\t', 1)[-1]
+            if ref.startswith('refs/heads/'):
+                branches.append(ref[len('refs/heads/'):])
+            elif ref.startswith('refs/tags/') and not ref.endswith('^{}'):
+                # Annotated tags are listed twice; skip the peeled entry
+                tags.append(ref[len('refs/tags/'):])
+        return sorted(branches), tags
+        
+    def _list_branch_names(self, project: Any) -> List[str]:
+        """Stream all branch names of a GitLab project."""
+        try:
+            return self._graphql_branch_names(project)
+        except Exception:
+            # Older self-hosted GitLab has no GraphQL API or no branchNames field
+            pass
+            
+        # Raw JSON pages avoid building a RESTObject per ref
+        branches = self.gitlab_client.http_list(
+            f"/projects/{project.id}/repository/branches", iterator=True, per_page=100
+        )
+        return [b['name'] for b in branches]
+        
+    def _graphql_branch_names(self, project: Any) -> List[str]:
+        """Fetch branch names through GitLab GraphQL, many more per request than REST."""
+        url = f"{self.gitlab_client.url}/api/graphql"
+        names: List[str] = []
+        while True:
+            data = self._graphql(url, self._credentials['gitlab'], GITLAB_BRANCH_NAMES_QUERY, {
+                'path': project.path_with_namespace, 'offset': len(names), 'limit': GITLAB_BRANCH_PAGE
+            })
+            page = data['project']['repository']['branchNames']
+            names.extend(page)
+            if len(page) < GITLAB_BRANCH_PAGE:
+                return names
+        
+    def _list_tag_names(self, project: Any, limit: int = 10) -> Tuple[List[str], int]:
+        """Return the first few tag names and the total tag count of a GitLab project."""
+        tags = self.gitlab_client.http_list(
+            f"/projects/{project.id}/repository/tags", iterator=True, per_page=100
+        )
+        names = [t['name'] for t in itertools.islice(tags, limit)]
+        # GitLab omits the total count header for very large lists
+        total = tags.total if tags.total is not None else len(names) + sum(1 for _ in tags)
+        return names, total
+        
     def analyze_gitlab_project(self, project: Any) -> Dict[str, Any]:
         """Analyze GitLab project and return detailed information."""
         try:
-            # Safely get attributes with fallbacks
-            def safe_get(obj, attr, default='Unknown'):
-                try:
-                    value = getattr(obj, attr, default)
-                    return value if value is not None else default
-                except Exception:
-                    return default
-            
-            # Get repository statistics safely
+            # Read fields straight from the API response; missing or null values get defaults
+            attrs = project.attributes
             stats = {
-                'name': safe_get(project, 'name', 'Unknown'),
-                'description': safe_get(project, 'description', 'No description'),
-                'visibility': safe_get(project, 'visibility', 'Unknown'),
-                'default_branch': safe_get(project, 'default_branch', 'main'),
-                'clone_url': safe_get(project, 'http_url_to_repo', 'Unknown'),
+                'name': attrs.get('name') or 'Unknown',
+                'description': attrs.get('description') or 'No description',
+                'visibility': attrs.get('visibility') or 'Unknown',
+                'default_branch': attrs.get('default_branch') or 'main',
+                'clone_url': attrs.get('http_url_to_repo') or 'Unknown',
                 'size_mb': 0,
                 'commit_count': 0,
                 'branches': [],
                 'tags': [],
-                'issues_enabled': safe_get(project, 'issues_enabled', True),
-                'merge_requests_enabled': safe_get(project, 'merge_requests_enabled', True),
-                'wiki_enabled': safe_get(project, 'wiki_enabled', True)
+                # Features count as enabled unless GitLab says otherwise
+                'issues_enabled': attrs.get('issues_enabled') is not False,
+                'merge_requests_enabled': attrs.get('merge_requests_enabled') is not False,
+                'wiki_enabled': attrs.get('wiki_enabled') is not False
             }
             
             # Try to get statistics safely
             try:
-                if hasattr(project, 'statistics') and project.statistics:
-                    stats['size_mb'] = round(project.statistics.get('repository_size', 0) / (1024 * 1024), 2)
-                    stats['commit_count'] = project.statistics.get('commit_count', 0)
+                statistics = attrs.get('statistics')
+                if statistics:
+                    stats['size_mb'] = round(statistics.get('repository_size', 0) / (1024 * 1024), 2)
+                    stats['commit_count'] = statistics.get('commit_count', 0)
             except Exception as e:
                 console.print(f"   Could not get repository statistics: {str(e)}", style="yellow")
             
+            # One git ls-remote lists every branch and tag; fall back to the API concurrently
+            remote_refs = self._ls_remote_refs(project)
+            if not remote_refs:
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    branches_future = executor.submit(self._list_branch_names, project)
+                    tags_future = executor.submit(self._list_tag_names, project)
+                
             # Get branches safely
             try:
-                branches = project.branches.list(all=True)
-                stats['branches'] = [b.name for b in branches]
+                branches = remote_refs[0] if remote_refs else branches_future.result()
+                stats['branches'] = branches
                 stats['branch_count'] = len(branches)
                 console.print(f"   Found {len(branches)} branches", style="blue")
             except Exception as e:
@@ -205,10 +657,11 @@ class GitTransfer:
                 
             # Get tags safely
             try:
-                tags = project.tags.list(all=True)
-                stats['tags'] = [t.name for t in tags[:10]]  # Show first 10 tags
-                stats['tag_count'] = len(tags)
-                console.print(f"   Found {len(tags)} tags", style="blue")
+                if remote_refs:
+                    stats['tags'], stats['tag_count'] = remote_refs[1][:10], len(remote_refs[1])
+                else:
+                    stats['tags'], stats['tag_count'] = tags_future.result()  # Show first 10 tags
+                console.print(f"   Found {stats['tag_count']} tags", style="blue")
             except Exception as e:
                 console.print(f"   Could not fetch tags: {str(e)}", style="yellow") 
                 stats['tags'] = ['Unable to fetch tags']
@@ -217,19 +670,17 @@ class GitTransfer:
             # Try alternative attribute names for default branch
             if stats['default_branch'] == 'Unknown':
                 try:
-                    # Try different possible attribute names
-                    for attr_name in ['default_branch', 'defaultBranch', 'master_branch']:
-                        if hasattr(project, attr_name):
-                            branch_val = getattr(project, attr_name)
-                            if branch_val:
-                                stats['default_branch'] = branch_val
-                                break
+                    # Try alternative attribute names
+                    stats['default_branch'] = (getattr(project, 'defaultBranch', None)
+                                               or getattr(project, 'master_branch', None)
+                                               or 'Unknown')
                     
                     # If still unknown, try to get it from branches list
                     if stats['default_branch'] == 'Unknown' and stats['branches']:
                         # Look for common default branch names
+                        branch_names = set(stats['branches'])
                         for common_branch in ['main', 'master', 'develop']:
-                            if common_branch in stats['branches']:
+                            if common_branch in branch_names:
                                 stats['default_branch'] = common_branch
                                 break
                         # If none found, use first branch
@@ -244,7 +695,10 @@ class GitTransfer:
             
         except Exception as e:
             console.print(f"❌ Failed to analyze project: {str(e)}", style="red")
-            console.print(f"   Available project attributes: {[attr for attr in dir(project) if not attr.startswith('_')][:10]}...", style="yellow")
+            # python-gitlab keeps the API fields in .attributes; avoid dir(), which walks the whole class
+            fields = getattr(project, 'attributes', None) or vars(project)
+            attributes = list(itertools.islice((attr for attr in fields if not attr.startswith('_')), 10))
+            console.print(f"   Available project attributes: {attributes}...", style="yellow")
             return {}
             
     def clone_gitlab_repo(self, project: Any, temp_dir: str) -> bool:
@@ -255,35 +709,25 @@ class GitTransfer:
             
         try:
             clone_url = project.http_url_to_repo
-            # Add token to URL for authentication
-            token = self.gitlab_client.private_token
-            auth_url = clone_url.replace('://', f'://oauth2:{token}@')
-            
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console
-            ) as progress:
-                task = progress.add_task("Cloning GitLab repository...", total=None)
-                
-                self.repo_clone = git.Repo.clone_from(
-                    auth_url, 
-                    temp_dir,
-                    bare=False,
-                    mirror=False
-                )
-                
-                # Fetch all branches and tags
-                progress.update(task, description="Fetching all branches and tags...")
-                origin = self.repo_clone.remotes.origin
-                origin.fetch(tags=True, prune=True)
-                
-                # Create local branches for all remote branches
-                for ref in origin.refs:
-                    if ref.name != 'origin/HEAD':
-                        branch_name = ref.name.replace('origin/', '')
-                        if branch_name not in [b.name for b in self.repo_clone.branches]:
-                            self.repo_clone.create_head(branch_name, ref)
+            # Authenticate with a header so the token stays out of the URL and .git/config
+            self._add_git_http_auth(clone_url, 'oauth2', self._credentials['gitlab'])
+            
+            # A bare clone fetches every branch and tag in one pass without a working tree,
+            # and unlike --mirror skips GitLab-internal refs that are never pushed
+            clone_options = ['--bare', '--progress']
+            if self.filter_blobs:
+                # Partial clone: file contents are fetched on demand while pushing
+                clone_options.append('--filter=blob:none')
+            elif self.object_cache:
+                cache_repo = self._update_object_cache(project, clone_url)
+                if cache_repo:
+                    # Borrow objects from the cache, then copy them so the clone stands alone
+                    clone_options.extend(['--reference', cache_repo, '--dissociate'])
+            
+            self._run_git(
+                ['clone', *clone_options, clone_url, temp_dir],
+                "Cloning GitLab repository..."
+            )
                 
             console.print("✅ Repository cloned successfully", style="green")
             return True
@@ -291,58 +735,147 @@ class GitTransfer:
             console.print(f"❌ Failed to clone repository: {str(e)}", style="red")
             return False
             
+    def _update_object_cache(self, project: Any, clone_url: str) -> Optional[str]:
+        """Create or refresh the cached bare copy of a project, returning its path."""
+        host = urllib.parse.urlsplit(clone_url).netloc
+        cache_repo = OBJECT_CACHE_DIR / host / f"{project.id}.git"
+        existed = cache_repo.exists()
+        
+        try:
+            if existed:
+                self._run_git(
+                    ['fetch', '--prune', '--progress', clone_url,
+                     '+refs/heads/*:refs/heads/*', '+refs/tags/*:refs/tags/*'],
+                    "Updating local object cache...",
+                    git_dir=str(cache_repo)
+                )
+            else:
+                cache_repo.parent.mkdir(parents=True, exist_ok=True)
+                self._run_git(
+                    ['clone', '--bare', '--progress', clone_url, str(cache_repo)],
+                    "Populating local object cache..."
+                )
+            return str(cache_repo)
+        except Exception as e:
+            if not existed:
+                shutil.rmtree(cache_repo, ignore_errors=True)
+            console.print(f"⚠️  Object cache unavailable, cloning without it: {str(e)}", style="yellow")
+            return None
+            
+    def _pack_size_kib(self) -> int:
+        """Size of the packs in the cloned repository, in KiB."""
+        result = subprocess.run(
+            ['git', '--git-dir', self.temp_dir, 'count-objects', '-v'],
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        stats = dict(line.split(': ', 1) for line in result.stdout.splitlines() if ': ' in line)
+        return int(stats.get('size-pack', 0))
+        
+    def repack_clone(self) -> bool:
+        """Recompute deltas in the cloned repository so the push uploads fewer bytes."""
+        if self.dry_run:
+            console.print("🔍 [DRY RUN] Would repack the cloned repository", style="yellow")
+            return True
+            
+        try:
+            size_before = self._pack_size_kib()
+            self._run_git(
+                ['repack', '-a', '-d', '-f', f'--window={REPACK_WINDOW}', f'--depth={REPACK_DEPTH}'],
+                "Repacking repository...",
+                git_dir=self.temp_dir
+            )
+            size_after = self._pack_size_kib()
+            console.print(f"✅ Repacked repository: {size_before / 1024:.1f} MB → {size_after / 1024:.1f} MB", style="green")
+            return True
+        except Exception as e:
+            # The original packs are still valid, so the push can go ahead
+            console.print(f"⚠️  Repack failed, pushing the clone as fetched: {str(e)}", style="yellow")
+            return True
+            
+    def _check_connectivity(self):
+        """Check that every ref in the clone and the history behind it is complete."""
+        self._run_git(
+            ['fsck', '--connectivity-only', '--no-dangling'],
+            "Checking repository integrity...",
+            git_dir=self.temp_dir
+        )
+        
+    def verify_gitlab_clone(self, project: Any) -> bool:
+        """Clone the repository history without file contents and check its integrity."""
+        self.temp_dir = tempfile.mkdtemp(prefix="git_verify_", dir=self.temp_root)
+        try:
+            clone_url = project.http_url_to_repo
+            self._add_git_http_auth(clone_url, 'oauth2', self._credentials['gitlab'])
+            
+            # Commits and trees are enough to check every ref and the history behind it
+            self._run_git(
+                ['clone', '--bare', '--progress', '--filter=blob:none', clone_url, self.temp_dir],
+                "Cloning repository history for verification..."
+            )
+            self._check_connectivity()
+            commit_count = subprocess.run(
+                ['git', '--git-dir', self.temp_dir, 'rev-list', '--count', '--all'],
+                capture_output=True,
+                text=True,
+                check=True
+            ).stdout.strip()
+            
+            console.print(f"✅ Clone verified: {commit_count} commits, {self._count_refs('refs/heads')} branches, "
+                          f"{self._count_refs('refs/tags')} tags", style="green")
+            return True
+        except Exception as e:
+            console.print(f"❌ Failed to verify repository clone: {str(e)}", style="red")
+            return False
+        finally:
+            self._remove_temp_dir()
+            self.temp_dir = None
+            
+    def _graphql(self, url: str, token: str, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a GraphQL query on the shared session and return its data."""
+        response = self._session.post(
+            url,
+            json={'query': query, 'variables': variables},
+            headers={'Authorization': f"Bearer {token}"},
+            timeout=API_TIMEOUT
+        )
+        response.raise_for_status()
+        payload = response.json()
+        # Missing objects come back as null data plus a NOT_FOUND error
+        errors = [error for error in payload.get('errors') or [] if error.get('type') != 'NOT_FOUND']
+        if errors:
+            raise RuntimeError(errors[0].get('message', 'GraphQL query failed'))
+        return payload.get('data') or {}
+        
     def validate_github_repo_creation(self, org_name: str, repo_name: str) -> bool:
         """Validate if GitHub repository can be created without actually creating it."""
         try:
             if org_name:
-                # Check if organization exists and user has access
-                try:
-                    org = self.github_client.get_organization(org_name)
-                    console.print(f"✅ Found GitHub organization: {org_name}", style="green")
-                    
-                    # Try to check if user is a member (this might fail for some org types)
-                    try:
-                        current_user = self.github_client.get_user()
-                        # Try to get the membership - different approach for GitHub Enterprise
-                        try:
-                            membership = org.get_membership(current_user.login)
-                            if membership.state == 'active':
-                                console.print(f"✅ Active member of organization: {org_name}", style="green")
-                            else:
-                                console.print(f"⚠️  Membership state: {membership.state}", style="yellow")
-                        except Exception as membership_error:
-                            # Fallback: try to list some repos to check access
-                            try:
-                                repos = list(org.get_repos(type='all'))[:1]  # Just get first repo to test access
-                                console.print(f"✅ Can access organization repositories", style="green")
-                            except Exception as repo_error:
-                                console.print(f"⚠️  Cannot verify organization membership: {str(membership_error)}", style="yellow")
-                                console.print(f"   Attempting to proceed anyway...", style="yellow")
-                    
-                    except Exception as user_error:
-                        console.print(f"⚠️  Cannot verify user access to organization: {str(user_error)}", style="yellow")
+                # Organization, membership and existing repository in a single request
+                org = self._graphql(GITHUB_GRAPHQL_URL, self._credentials['github'], GITHUB_ORG_REPO_QUERY, {'org': org_name, 'name': repo_name}).get('organization')
+                if org is None:
+                    console.print(f"❌ Cannot access GitHub organization '{org_name}'", style="red")
+                    return False
+                console.print(f"✅ Found GitHub organization: {org_name}", style="green")
+                
+                if org.get('viewerIsAMember'):
+                    console.print(f"✅ Active member of organization: {org_name}", style="green")
+                else:
+                    console.print(f"⚠️  Cannot verify organization membership for {self.github_user.login}", style="yellow")
+                    console.print(f"   Attempting to proceed anyway...", style="yellow")
+                if not org.get('viewerCanCreateRepositories'):
+                    console.print(f"⚠️  You may not be allowed to create repositories in {org_name}", style="yellow")
                     
-                    # Check if repository name already exists
-                    try:
-                        existing_repo = org.get_repo(repo_name)
-                        console.print(f"❌ Repository {org_name}/{repo_name} already exists", style="red")
-                        return False
-                    except Exception:
-                        # Repository doesn't exist, which is good
-                        pass
-                        
-                except Exception as org_error:
-                    console.print(f"❌ Cannot access GitHub organization '{org_name}': {str(org_error)}", style="red")
+                if org.get('repository'):
+                    console.print(f"❌ Repository {org_name}/{repo_name} already exists", style="red")
                     return False
             else:
                 # Check personal account
-                try:
-                    existing_repo = self.github_client.get_user().get_repo(repo_name)
+                viewer = self._graphql(GITHUB_GRAPHQL_URL, self._credentials['github'], GITHUB_VIEWER_REPO_QUERY, {'name': repo_name}).get('viewer') or {}
+                if viewer.get('repository'):
                     console.print(f"❌ Repository {repo_name} already exists in personal account", style="red")
                     return False
-                except Exception:
-                    # Repository doesn't exist, which is good
-                    pass
                     
             console.print(f"✅ GitHub repository name '{repo_name}' is available", style="green")
             return True
@@ -351,7 +884,13 @@ class GitTransfer:
             console.print(f"❌ Failed to validate GitHub repository: {str(e)}", style="red")
             return False
     
-    def create_github_repo(self, org_name: str, repo_name: str, description: str = "") -> Optional[Repository.Repository]:
+    def _get_github_org(self, org_name: str) -> Any:
+        """Get a GitHub organization, fetching each one only once."""
+        if org_name not in self._github_orgs:
+            self._github_orgs[org_name] = self.github_client.get_organization(org_name)
+        return self._github_orgs[org_name]
+        
+    def create_github_repo(self, org_name: str, repo_name: str, description: str = "") -> Optional["Repository.Repository"]:
         """Create GitHub repository in specified organization."""
         if self.dry_run:
             console.print(f"🔍 [DRY RUN] Would create GitHub repository: {org_name}/{repo_name if org_name else repo_name}", style="yellow")
@@ -359,7 +898,7 @@ class GitTransfer:
             
         try:
             if org_name:
-                org = self.github_client.get_organization(org_name)
+                org = self._get_github_org(org_name)
                 github_repo = org.create_repo(
                     name=repo_name,
                     description=description,
@@ -370,7 +909,7 @@ class GitTransfer:
                 )
             else:
                 # Create in personal account
-                github_repo = self.github_client.get_user().create_repo(
+                github_repo = self.github_user.create_repo(
                     name=repo_name,
                     description=description,
                     private=True,
@@ -385,7 +924,7 @@ class GitTransfer:
             console.print(f"❌ Failed to create GitHub repository: {str(e)}", style="red")
             return None
             
-    def push_to_github(self, github_repo: Repository.Repository) -> bool:
+    def push_to_github(self, github_repo: "Repository.Repository") -> bool:
         """Push cloned repository to GitHub."""
         if self.dry_run:
             console.print(f"🔍 [DRY RUN] Would push repository to: {github_repo.clone_url if github_repo else 'GitHub'}", style="yellow")
@@ -394,82 +933,32 @@ class GitTransfer:
         try:
             clone_url = github_repo.clone_url
             
-            # Get the GitHub token - try multiple methods for different PyGithub versions
-            github_token = None
-            try:
-                # Method 1: Try the direct approach (newer versions)
-                if hasattr(self.github_client, '_Github__requester'):
-                    requester = self.github_client._Github__requester
-                    if hasattr(requester, '_Requester__authorizationHeader'):
-                        github_token = requester._Requester__authorizationHeader.split()[-1]
-                    elif hasattr(requester, 'auth'):
-                        # Handle token-based auth
-                        if hasattr(requester.auth, 'token'):
-                            github_token = requester.auth.token
-            except Exception:
-                pass
-                
-            # Method 2: Alternative approach for different versions
-            if not github_token:
-                try:
-                    # Try accessing the token through the auth object
-                    auth = getattr(self.github_client, '_Github__auth', None)
-                    if auth and hasattr(auth, 'token'):
-                        github_token = auth.token
-                except Exception:
-                    pass
-            
-            # Method 3: If we still don't have the token, we'll need to use a different approach
-            if not github_token:
-                console.print("⚠️  Cannot extract GitHub token from client. Using clone URL with placeholder.", style="yellow")
-                # We'll need to modify the URL differently
-                # Get the clone URL and modify it to use token authentication
-                auth_url = github_repo.clone_url
-                # This will require the user to have git credentials configured
-            else:
-                # Create authenticated URL
-                auth_url = clone_url.replace('https://', f'https://{github_token}@')
-            
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console
-            ) as progress:
-                task = progress.add_task("Setting up GitHub remote...", total=None)
-                
-                # Add GitHub as remote
-                if 'github' in [r.name for r in self.repo_clone.remotes]:
-                    # Remove existing github remote if it exists
-                    self.repo_clone.delete_remote('github')
-                
-                github_remote = self.repo_clone.create_remote('github', auth_url)
-                
-                # Get list of local branches
-                local_branches = [branch.name for branch in self.repo_clone.branches]
-                console.print(f"   Found {len(local_branches)} local branches to push")
-                
-                # Push all branches
-                progress.update(task, description="Pushing branches to GitHub...")
-                for branch in self.repo_clone.branches:
-                    try:
-                        self.repo_clone.git.checkout(branch.name)
-                        github_remote.push(refspec=f'{branch.name}:{branch.name}')
-                        console.print(f"   ✅ Pushed branch: {branch.name}")
-                    except Exception as branch_error:
-                        console.print(f"   ⚠️  Failed to push branch {branch.name}: {str(branch_error)}", style="yellow")
-                
-                # Push all tags
-                progress.update(task, description="Pushing tags to GitHub...")
-                try:
-                    # Get list of tags
-                    tags = list(self.repo_clone.tags)
-                    if tags:
-                        github_remote.push(tags=True)
-                        console.print(f"   ✅ Pushed {len(tags)} tags")
-                    else:
-                        console.print("   ℹ️  No tags to push")
-                except Exception as tag_error:
-                    console.print(f"   ⚠️  Failed to push tags: {str(tag_error)}", style="yellow")
+            # Authenticate with a header so the token stays out of the URL
+            self._add_git_http_auth(clone_url, 'x-access-token', self._credentials['github'])
+            
+            branch_count = self._count_refs('refs/heads')
+            tag_count = self._count_refs('refs/tags')
+            console.print(f"   Found {branch_count} branches and {tag_count} tags to push")
+            
+            # Push all branches and tags atomically in a single negotiation. Explicit refspecs
+            # keep GitLab-internal refs (merge-requests, pipelines, keep-around) out of GitHub.
+            result = self._run_git(
+                ['push', '--atomic', '--porcelain', '--progress', clone_url,
+                 'refs/heads/*:refs/heads/*', 'refs/tags/*:refs/tags/*'],
+                "Pushing repository to GitHub...",
+                git_dir=self.temp_dir,
+                check=False
+            )
+            
+            rejected = self._rejected_refs(result.stdout)
+            if rejected:
+                # With --atomic every other ref is reported as "atomic push failed"; show the cause
+                causes = [(ref, reason) for ref, reason in rejected if 'atomic push failed' not in reason]
+                console.print("❌ GitHub rejected the push, no refs were updated:", style="red")
+                for ref, reason in causes or rejected:
+                    console.print(f"   {ref}: {reason}", style="red")
+            if result.returncode != 0 or rejected:
+                raise RuntimeError(f"git push failed: {result.stderr}")
                 
             console.print("✅ Repository pushed to GitHub successfully", style="green")
             return True
@@ -481,23 +970,122 @@ class GitTransfer:
             console.print("   You may need to push manually using git commands", style="yellow")
             return False
             
+    def _get_existing_github_repo(self, org_name: str, repo_name: str) -> Optional["Repository.Repository"]:
+        """Get the existing GitHub repository a tag is copied to."""
+        full_name = f"{org_name or self.github_user.login}/{repo_name}"
+        try:
+            github_repo = self.github_client.get_repo(full_name)
+        except Exception as e:
+            console.print(f"❌ GitHub repository {full_name} not found: {str(e)}", style="red")
+            return None
+        console.print(f"✅ Found GitHub repository: {full_name}", style="green")
+        return github_repo
+        
+    def validate_tag_sync(self, project: Any, github_org: str, repo_name: str) -> bool:
+        """Check that a tag exists on GitLab and the GitHub repository accepts pushes, without pushing."""
+        github_repo = self._get_existing_github_repo(github_org, repo_name)
+        if not github_repo:
+            return False
+        if not (github_repo.permissions and github_repo.permissions.push):
+            console.print(f"❌ No push access to GitHub repository {github_repo.full_name}", style="red")
+            return False
+        console.print(f"✅ Push access to {github_repo.full_name}", style="green")
+        
+        remote_refs = self._ls_remote_refs(project)
+        if remote_refs:
+            tag_found = self.tag in remote_refs[1]
+        else:
+            try:
+                project.tags.get(self.tag)
+                tag_found = True
+            except Exception:
+                tag_found = False
+        if not tag_found:
+            console.print(f"❌ Tag {self.tag} not found in GitLab project {project.path_with_namespace}", style="red")
+            return False
+        console.print(f"✅ Found tag {self.tag} in GitLab", style="green")
+        return True
+        
+    def sync_tag(self, project: Any, github_repo: "Repository.Repository") -> bool:
+        """Copy a single tag from GitLab to an existing GitHub repository."""
+        ref = f"refs/tags/{self.tag}"
+        try:
+            gitlab_url = project.http_url_to_repo
+            github_url = github_repo.clone_url
+            self._add_git_http_auth(gitlab_url, 'oauth2', self._credentials['gitlab'])
+            self._add_git_http_auth(github_url, 'x-access-token', self._credentials['github'])
+            
+            # Commits only (no trees or blobs) of what GitHub already has. They are enough for
+            # GitLab to send just the objects that are new in the tag, and for the push to send
+            # the same. A shallow fetch would be smaller still, but GitHub rejects shallow pushes.
+            self._run_git(
+                ['clone', '--bare', '--progress', '--filter=tree:0', github_url, self.temp_dir],
+                "Fetching commit history from GitHub..."
+            )
+            self._run_git(
+                ['fetch', '--no-tags', '--progress', gitlab_url, f"+{ref}:{ref}"],
+                f"Fetching tag {self.tag} from GitLab...",
+                git_dir=self.temp_dir
+            )
+            result = self._run_git(
+                ['push', '--porcelain', '--progress', github_url, f"{ref}:{ref}"],
+                f"Pushing tag {self.tag} to GitHub...",
+                git_dir=self.temp_dir,
+                check=False
+            )
+            
+            rejected = self._rejected_refs(result.stdout)
+            for rejected_ref, reason in rejected:
+                console.print(f"❌ GitHub rejected {rejected_ref}: {reason}", style="red")
+            if result.returncode != 0 or rejected:
+                raise RuntimeError(f"git push failed: {result.stderr}")
+                
+            console.print(f"✅ Tag {self.tag} pushed to GitHub successfully", style="green")
+            return True
+        except Exception as e:
+            console.print(f"❌ Failed to sync tag {self.tag}: {str(e)}", style="red")
+            return False
+            
+    def fork(self) -> "GitTransfer":
+        """Create a transfer for another repository that shares this one's clients and caches."""
+        transfer = copy.copy(self)
+        transfer.temp_dir = None
+        # Each transfer adds its own auth headers
+        transfer._git_config = dict(self._git_config)
+        return transfer
+        
+    def _setup_clients(self, gitlab_url: str, gitlab_token: str, github_token: str,
+                       verify_gitlab: bool = True) -> bool:
+        """Set up the GitLab and GitHub clients that are not ready yet, concurrently."""
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            setups = []
+            if self.gitlab_client is None:
+                setups.append(executor.submit(self.setup_gitlab_client, gitlab_url, gitlab_token, verify_gitlab))
+            if self.github_client is None:
+                setups.append(executor.submit(self.setup_github_client, github_token))
+        return all(setup.result() for setup in setups)
+        
     def dry_run_analysis(self, gitlab_url: str, gitlab_token: str, github_token: str,
                         gitlab_project_url: str, github_org: str, new_repo_name: str) -> bool:
         """Perform dry run analysis without making any changes."""
         console.print("\n🔍 Starting dry run analysis...\n")
         
-        # Setup clients
-        if not self.setup_gitlab_client(gitlab_url, gitlab_token):
-            return False
-            
-        if not self.setup_github_client(github_token):
+        # Setup clients (reused if an earlier run on this instance already authenticated)
+        if not self._setup_clients(gitlab_url, gitlab_token, github_token):
             return False
             
         # Get GitLab project
-        gitlab_project = self.get_gitlab_project(gitlab_project_url)
+        gitlab_project = self.get_gitlab_project(gitlab_project_url, statistics=True)
         if not gitlab_project:
             return False
             
+        # A tag is copied into an existing repository, so the full-transfer checks don't apply
+        if self.tag:
+            if not self.validate_tag_sync(gitlab_project, github_org, new_repo_name or gitlab_project.name):
+                return False
+            console.print(f"\n✅ Dry run completed successfully! Tag {self.tag} can be synced.", style="bold green")
+            return True
+            
         # Analyze GitLab project
         project_stats = self.analyze_gitlab_project(gitlab_project)
         if not project_stats:
@@ -506,6 +1094,9 @@ class GitTransfer:
         # Display detailed analysis
         self._display_project_analysis(project_stats, github_org, new_repo_name)
         
+        if self.verify_clone and not self.verify_gitlab_clone(gitlab_project):
+            return False
+        
         # Validate GitHub repository creation
         target_repo_name = new_repo_name or gitlab_project.name
         if not self.validate_github_repo_creation(github_org, target_repo_name):
@@ -517,6 +1108,8 @@ class GitTransfer:
         
     def _display_project_analysis(self, stats: Dict[str, Any], github_org: str, new_repo_name: str):
         """Display detailed project analysis."""
+        from rich.table import Table
+        
         table = Table(title="GitLab Project Analysis", show_header=True, header_style="bold magenta")
         table.add_column("Property", style="cyan", no_wrap=True)
         table.add_column("Value", style="white")
@@ -566,34 +1159,56 @@ class GitTransfer:
             
         console.print("\n🚀 Starting GitLab to GitHub repository transfer...\n")
         
-        # Setup clients
-        if not self.setup_gitlab_client(gitlab_url, gitlab_token):
-            return False
-            
-        if not self.setup_github_client(github_token):
+        # Setup clients (reused if an earlier run on this instance already authenticated)
+        if not self._setup_clients(gitlab_url, gitlab_token, github_token, verify_gitlab=False):
             return False
             
         # Get GitLab project
         gitlab_project = self.get_gitlab_project(gitlab_project_url)
-        if not gitlab_project:
+        if not gitlab_project or self._cancelled.is_set():
             return False
             
         # Create temporary directory
-        self.temp_dir = tempfile.mkdtemp(prefix="git_transfer_")
+        self.temp_dir = tempfile.mkdtemp(prefix="git_transfer_", dir=self.temp_root)
         console.print(f"📁 Using temporary directory: {self.temp_dir}")
         
         try:
+            if self.tag:
+                github_repo = self._get_existing_github_repo(github_org, new_repo_name or gitlab_project.name)
+                if not github_repo:
+                    return False
+                if not self.sync_tag(gitlab_project, github_repo):
+                    return False
+                console.print(f"\n🎉 Tag {self.tag} synced to {github_repo.html_url}", style="bold green")
+                return True
+                
             # Clone GitLab repository
             if not self.clone_gitlab_repo(gitlab_project, self.temp_dir):
                 return False
                 
+            # Partial clones are skipped: repacking them would not cover the missing blobs
+            if self.repack and not self.filter_blobs:
+                self.repack_clone()
+                
+            if self.verify_clone:
+                try:
+                    self._check_connectivity()
+                except Exception as e:
+                    console.print(f"❌ Clone failed verification, no GitHub repository was created: {str(e)}", style="red")
+                    return False
+                console.print("✅ Clone verified", style="green")
+                
+            # After Ctrl-C, stop before anything is created on GitHub
+            if self._cancelled.is_set():
+                return False
+                
             # Create GitHub repository
             github_repo = self.create_github_repo(
                 github_org, 
                 new_repo_name or gitlab_project.name,
                 gitlab_project.description or ""
             )
-            if not github_repo:
+            if not github_repo or self._cancelled.is_set():
                 return False
                 
             # Push to GitHub
@@ -607,15 +1222,79 @@ class GitTransfer:
         finally:
             # Cleanup
             if self.temp_dir and os.path.exists(self.temp_dir):
-                shutil.rmtree(self.temp_dir)
-                console.print(f"🧹 Cleaned up temporary directory")
+                self._remove_temp_dir()
+                console.print(f"🧹 Removing temporary directory")
+
+                
+    def transfer_repositories(self, gitlab_url: str, gitlab_token: str, github_token: str,
+                              repos: List[TransferConfig], github_org: str,
+                              workers: int = DEFAULT_PARALLEL_TRANSFERS) -> bool:
+        """Transfer several repositories concurrently, sharing one set of API clients."""
+        # Authenticate once up front instead of in every worker
+        if not self._setup_clients(gitlab_url, gitlab_token, github_token, verify_gitlab=self.dry_run):
+            return False
+            
+        def transfer_one(repo: TransferConfig) -> bool:
+            try:
+                return self.fork().transfer_repository(gitlab_url, gitlab_token, github_token,
+                                                       repo.gitlab_project_url, github_org, repo.new_repo_name)
+            except Exception as e:
+                console.print(f"❌ Transfer of {repo.gitlab_project_url} failed: {str(e)}", style="red")
+                return False
+                
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(transfer_one, repo) for repo in repos]
+            try:
+                results = [future.result() for future in futures]
+            except KeyboardInterrupt:
+                # Drop the repositories that haven't started; running ones stop at their next step
+                for future in futures:
+                    future.cancel()
+                raise
+            
+        from rich.table import Table
+        
+        table = Table(title="Transfer Results", show_header=True, header_style="bold magenta")
+        table.add_column("GitLab Project", style="cyan")
+        table.add_column("GitHub Name", style="white")
+        table.add_column("Result")
+        for repo, succeeded in zip(repos, results):
+            table.add_row(repo.gitlab_project_url, repo.new_repo_name or "(same)", "✅" if succeeded else "❌")
+        console.print()
+        console.print(table)
+        
+        return all(results)
 
 
 @click.command()
 @click.option('--dry-run', is_flag=True, help='Perform validation checks without making any changes')
-def main(dry_run):
+@click.option('--filter-blobs', is_flag=True, help='Clone without file contents up front (partial clone); they are fetched while pushing')
+@click.option('--object-cache', is_flag=True, help='Keep a copy of the repository in ~/.cache/gittransfer so repeat transfers only fetch new objects')
+@click.option('--temp-dir', type=click.Path(exists=True, file_okay=False, writable=True),
+              help='Directory for the temporary clone, e.g. a tmpfs such as /dev/shm for faster I/O')
+@click.option('--repos-file', type=click.File('r'),
+              help='Transfer every GitLab project listed in the file (one per line, optionally followed by a new name)')
+@click.option('--parallel', type=click.IntRange(min=1), default=DEFAULT_PARALLEL_TRANSFERS, show_default=True,
+              help='Number of repositories transferred at once with --repos-file')
+@click.option('--http-cache', is_flag=True,
+              help='Keep GitLab API responses in ~/.cache/gittransfer/http and revalidate them on later runs')
+@click.option('--verify-clone', is_flag=True,
+              help='Check the integrity of the clone (before pushing, or with --dry-run on a clone without file contents)')
+@click.option('--repack', is_flag=True,
+              help='Recompress the clone before pushing; uses more local CPU to upload fewer bytes')
+@click.option('--tag', help='Only copy this tag to a GitHub repository an earlier transfer created')
+def main(dry_run, filter_blobs, object_cache, temp_dir, repos_file, parallel, http_cache, verify_clone, repack, tag):
     """GitLab to GitHub Repository Transfer Tool"""
+    from rich.panel import Panel
+    from rich.prompt import Prompt, Confirm
     
+    # A single tag is fetched and pushed directly, without the clone these options act on
+    clone_options = {'--filter-blobs': filter_blobs, '--object-cache': object_cache,
+                     '--verify-clone': verify_clone, '--repack': repack}
+    unused_options = [option for option, enabled in clone_options.items() if enabled]
+    if tag and unused_options:
+        raise click.UsageError(f"--tag cannot be combined with {', '.join(unused_options)}")
+        
     mode_text = "DRY RUN MODE - Validation Only" if dry_run else "Transfer Mode"
     mode_style = "yellow" if dry_run else "blue"
     
@@ -629,16 +1308,36 @@ def main(dry_run):
     
     # Collect user inputs
     gitlab_url = Prompt.ask("\n[bold]GitLab instance URL[/bold] (e.g., https://gitlab.company.com)")
-    gitlab_token = Prompt.ask("[bold]GitLab personal access token[/bold]", password=True)
-    github_token = Prompt.ask("[bold]GitHub personal access token[/bold]", password=True)
     
-    gitlab_project_url = Prompt.ask("\n[bold]GitLab project URL or path[/bold] (e.g., https://gitlab.com/owner/repo or owner/repo)")
+    # Connect to both APIs in the background while the remaining questions are answered;
+    # the connections stay in the session the transfer uses
+    session = create_session(http_cache)
+    for api_url in (gitlab_url, GITHUB_API_URL):
+        threading.Thread(target=prewarm_connection, args=(session, api_url), daemon=True).start()
+    
+    # Check the instance is reachable while the tokens are being typed
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        gitlab_probe = executor.submit(probe_gitlab, gitlab_url)
+        gitlab_token = Prompt.ask("[bold]GitLab personal access token[/bold]", password=True)
+        github_token = Prompt.ask("[bold]GitHub personal access token[/bold]", password=True)
+    probe_error = gitlab_probe.result()
+    if probe_error:
+        console.print(f"❌ Cannot reach GitLab at {gitlab_url}: {probe_error}", style="red")
+        sys.exit(1)
+    
+    repos = read_repos_file(repos_file) if repos_file else []
+    if repos_file and not repos:
+        console.print("❌ No projects found in the repository list", style="red")
+        sys.exit(1)
+        
+    gitlab_project_url = None
+    if not repos:
+        gitlab_project_url = Prompt.ask("\n[bold]GitLab project URL or path[/bold] (e.g., https://gitlab.com/owner/repo or owner/repo)")
     github_org = Prompt.ask("[bold]GitHub organization name[/bold] (leave empty for personal account)", default="")
     
-    # Ask for new repository name
-    use_different_name = Confirm.ask("Do you want to use a different name for the GitHub repository?")
+    # Ask for new repository name (a repository list carries its own names)
     new_repo_name = None
-    if use_different_name:
+    if not repos and Confirm.ask("Do you want to use a different name for the GitHub repository?"):
         new_repo_name = Prompt.ask("[bold]New repository name[/bold]")
         
     # Ask for dry run if not specified via CLI
@@ -649,12 +1348,17 @@ def main(dry_run):
     # Confirmation
     action = "Dry Run Analysis" if dry_run else "Transfer"
     console.print(f"\n[bold yellow]{action} Summary:[/bold yellow]")
-    console.print(f"📤 From: {gitlab_project_url}")
+    if repos:
+        console.print(f"📤 From: {len(repos)} projects in {repos_file.name} ({min(parallel, len(repos))} at a time)")
+    else:
+        console.print(f"📤 From: {gitlab_project_url}")
     console.print(f"📥 To: GitHub {'organization' if github_org else 'personal account'}: {github_org or 'personal'}")
     if new_repo_name:
         console.print(f"📝 New name: {new_repo_name}")
     if dry_run:
         console.print("🔍 Mode: Validation only (no changes will be made)")
+    if tag:
+        console.print(f"🏷️  Mode: Only tag {tag}, into the existing GitHub repository")
     
     proceed_text = f"Proceed with the {action.lower()}?"
     if not Confirm.ask(f"\n{proceed_text}"):
@@ -662,22 +1366,40 @@ def main(dry_run):
         return
     
     # Perform transfer or dry run
-    transfer = GitTransfer(dry_run=dry_run)
-    success = transfer.transfer_repository(
-        gitlab_url=gitlab_url,
-        gitlab_token=gitlab_token,
-        github_token=github_token,
-        gitlab_project_url=gitlab_project_url,
-        github_org=github_org,
-        new_repo_name=new_repo_name
-    )
+    transfer = GitTransfer(dry_run=dry_run, filter_blobs=filter_blobs, object_cache=object_cache,
+                           temp_root=temp_dir, show_progress=len(repos) <= 1 or parallel == 1,
+                           http_cache=http_cache, verify_clone=verify_clone, repack=repack, tag=tag,
+                           session=session)
+    signal.signal(signal.SIGINT, transfer._on_sigint)
+    try:
+        if repos:
+            success = transfer.transfer_repositories(
+                gitlab_url=gitlab_url,
+                gitlab_token=gitlab_token,
+                github_token=github_token,
+                repos=repos,
+                github_org=github_org,
+                workers=parallel
+            )
+        else:
+            success = transfer.transfer_repository(
+                gitlab_url=gitlab_url,
+                gitlab_token=gitlab_token,
+                github_token=github_token,
+                gitlab_project_url=gitlab_project_url,
+                github_org=github_org,
+                new_repo_name=new_repo_name
+            )
+    except KeyboardInterrupt:
+        console.print(f"\n🛑 {action} interrupted.", style="yellow")
+        sys.exit(130)
     
     if not success:
         action = "Dry run" if dry_run else "Transfer"
         console.print(f"\n❌ {action} failed. Please check the errors above.", style="red")
         if dry_run:
             console.print("\n💡 Fix the issues above before attempting the actual transfer.", style="blue")
-        exit(1)
+        sys.exit(1)
     elif dry_run:
         console.print("\n🎯 To perform the actual transfer, run the command again without --dry-run", style="blue")
 
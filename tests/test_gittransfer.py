@@ -0,0 +1,264 @@
+"""Tests for the repository transfer tool."""
+
+import http.server
+import signal
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+import requests
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import gittransfer  # noqa: E402
+
+
+def make_transfer(tags=("v1.0",), can_push=True):
+    """A dry-run tag transfer with stubbed clients, GitLab project and GitHub repository."""
+    transfer = gittransfer.GitTransfer(dry_run=True, show_progress=False, tag="v1.0")
+    github_repo = SimpleNamespace(full_name="acme/widgets", permissions=SimpleNamespace(push=can_push))
+    transfer.gitlab_client = mock.Mock()
+    transfer.github_client = mock.Mock(**{"get_repo.return_value": github_repo})
+    transfer.github_user = SimpleNamespace(login="someone")
+    project = SimpleNamespace(name="widgets", path_with_namespace="group/widgets")
+    transfer.get_gitlab_project = mock.Mock(return_value=project)
+    transfer._ls_remote_refs = mock.Mock(return_value=(["main"], list(tags)))
+    transfer.validate_github_repo_creation = mock.Mock(return_value=False)
+    return transfer
+
+
+def run(transfer):
+    return transfer.transfer_repository("https://gitlab.example.com", "gl-token", "gh-token",
+                                        "group/widgets", "acme", None)
+
+
+def test_tag_dry_run_checks_the_existing_repository():
+    transfer = make_transfer()
+    assert run(transfer)
+    transfer.github_client.get_repo.assert_called_once_with("acme/widgets")
+    # The repository already existing must not fail the dry run
+    transfer.validate_github_repo_creation.assert_not_called()
+
+
+def test_tag_dry_run_fails_when_tag_is_missing():
+    assert not run(make_transfer(tags=("v0.9",)))
+
+
+def test_tag_dry_run_fails_without_push_access():
+    assert not run(make_transfer(can_push=False))
+
+
+def test_tag_dry_run_fails_when_repository_does_not_exist():
+    transfer = make_transfer()
+    transfer.github_client.get_repo.side_effect = Exception("404 Not Found")
+    assert not run(transfer)
+
+
+def test_interrupt_stops_running_git_and_later_steps():
+    transfer = gittransfer.GitTransfer(show_progress=False)
+    worker = transfer.fork()
+    started = threading.Event()
+    errors = []
+
+    def run_git():
+        started.set()
+        try:
+            worker._run_git(["-c", "alias.wait=!sleep 30", "wait"], "Waiting...")
+        except RuntimeError as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=run_git)
+    thread.start()
+    started.wait()
+    while not transfer._git_processes:
+        time.sleep(0.01)
+
+    with pytest.raises(KeyboardInterrupt):
+        transfer._on_sigint(signal.SIGINT, None)
+    thread.join(timeout=10)
+    assert not thread.is_alive() and errors
+    assert not transfer._git_processes
+
+    # Forks share the flag, so no further git step starts
+    with pytest.raises(RuntimeError, match="cancelled"):
+        transfer.fork()._run_git(["--version"], "Checking git...")
+
+
+class FlakyGraphQLHandler(http.server.BaseHTTPRequestHandler):
+    """Answers the first POST with 503 and the next with a GraphQL payload."""
+    posts = 0
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        type(self).posts += 1
+        body = b'{"data": {"viewer": {"repository": null}}}'
+        self.send_response(503 if self.posts == 1 else 200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_graphql_posts_are_retried():
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), FlakyGraphQLHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        transfer = gittransfer.GitTransfer(show_progress=False)
+        data = transfer._graphql(f"http://127.0.0.1:{server.server_port}/graphql", "token",
+                                 gittransfer.GITHUB_VIEWER_REPO_QUERY, {"name": "widgets"})
+    finally:
+        server.shutdown()
+    assert data == {"viewer": {"repository": None}}
+    assert FlakyGraphQLHandler.posts == 2
+
+
+class FakeGitLab:
+    """Stands in for the network below ETagCacheAdapter, answering 304 when the ETag matches."""
+
+    def __init__(self):
+        self.requests = []
+
+    def send(self, request, **kwargs):
+        self.requests.append(request.copy())
+        response = requests.Response()
+        response.request = request
+        response.url = request.url
+        if request.headers.get("If-None-Match") == '"v1"':
+            response.status_code = 304
+            response.headers["ETag"] = '"v1"'
+            response._content = b""
+        else:
+            response.status_code = 200
+            response.headers.update({"ETag": '"v1"', "X-Total": "42", "Content-Type": "application/json"})
+            response._content = b'[{"id": 1}]'
+        return response
+
+
+def cached_session(cache_dir):
+    session = requests.Session()
+    session.mount("https://", gittransfer.ETagCacheAdapter(cache_dir))
+    return session
+
+
+def test_etag_cache_replays_unchanged_responses(tmp_path):
+    server = FakeGitLab()
+    session = cached_session(tmp_path)
+    url = "https://gitlab.example.com/api/v4/projects/1/issues"
+    with mock.patch.object(gittransfer.HTTPAdapter, "send", side_effect=server.send):
+        first = session.get(url, headers={"PRIVATE-TOKEN": "token-a"})
+        second = session.get(url, headers={"PRIVATE-TOKEN": "token-a"})
+
+    assert "If-None-Match" not in server.requests[0].headers
+    assert server.requests[1].headers["If-None-Match"] == '"v1"'
+    # The 304 is answered from the cache, pagination headers included
+    assert second.status_code == 200
+    assert second.json() == first.json() == [{"id": 1}]
+    assert second.headers["X-Total"] == "42"
+
+
+def test_etag_cache_is_keyed_by_token(tmp_path):
+    server = FakeGitLab()
+    session = cached_session(tmp_path)
+    url = "https://gitlab.example.com/api/v4/projects/1/issues"
+    with mock.patch.object(gittransfer.HTTPAdapter, "send", side_effect=server.send):
+        session.get(url, headers={"PRIVATE-TOKEN": "token-a"})
+        other = session.get(url, headers={"PRIVATE-TOKEN": "token-b"})
+
+    assert "If-None-Match" not in server.requests[1].headers
+    assert other.status_code == 200
+
+
+def test_read_repos_file_skips_comments_and_blank_lines():
+    lines = [
+        "# projects to move\n",
+        "group/alpha\n",
+        "\n",
+        "   \n",
+        "group/beta  beta-renamed  # keeps its history\n",
+    ]
+    assert gittransfer.read_repos_file(lines) == [
+        gittransfer.TransferConfig("group/alpha"),
+        gittransfer.TransferConfig("group/beta", "beta-renamed"),
+    ]
+
+
+def test_fork_shares_clients_and_cancellation_but_not_repository_state():
+    transfer = gittransfer.GitTransfer(show_progress=False)
+    transfer.temp_dir = "/tmp/git_transfer_parent"
+    worker = transfer.fork()
+
+    assert worker._session is transfer._session
+    assert worker._git_processes is transfer._git_processes
+    assert worker._cancelled is transfer._cancelled
+    assert worker.temp_dir is None
+    worker._add_git_http_auth("https://gitlab.example.com/group/alpha.git", "oauth2", "token")
+    assert "http.https://gitlab.example.com/.extraheader" not in transfer._git_config
+
+
+attempted = []
+
+
+def fake_transfer_repository(self, gitlab_url, gitlab_token, github_token, gitlab_project_url, github_org,
+                             new_repo_name):
+    """Fails one project and succeeds for the rest, recording which ones were attempted."""
+    attempted.append(gitlab_project_url)
+    if gitlab_project_url == "group/broken":
+        raise RuntimeError("clone failed")
+    return True
+
+
+def test_one_failing_repository_does_not_stop_the_others():
+    attempted.clear()
+    transfer = gittransfer.GitTransfer(show_progress=False)
+    transfer.gitlab_client = transfer.github_client = mock.Mock()
+    repos = [gittransfer.TransferConfig(name) for name in ("group/alpha", "group/broken", "group/gamma")]
+    with mock.patch.object(gittransfer.GitTransfer, "transfer_repository", fake_transfer_repository):
+        assert not transfer.transfer_repositories("https://gitlab.example.com", "gl", "gh", repos, "acme", workers=2)
+    assert sorted(attempted) == ["group/alpha", "group/broken", "group/gamma"]
+
+    attempted.clear()
+    with mock.patch.object(gittransfer.GitTransfer, "transfer_repository", fake_transfer_repository):
+        assert transfer.transfer_repositories("https://gitlab.example.com", "gl", "gh", repos[::2], "acme")
+
+
+def test_repos_file_exit_status(tmp_path):
+    from click.testing import CliRunner
+
+    repos_file = tmp_path / "repos.txt"
+    answers = {"GitLab instance URL": "https://gitlab.example.com", "GitHub organization name": "acme"}
+
+    def run(projects):
+        attempted.clear()
+        repos_file.write_text("\n".join(projects) + "\n")
+        with mock.patch("rich.prompt.Prompt.ask", side_effect=lambda text, **kwargs: next(
+                (answer for prompt, answer in answers.items() if prompt in text), "token")), \
+                mock.patch("rich.prompt.Confirm.ask", return_value=True), \
+                mock.patch.object(gittransfer, "probe_gitlab", return_value=None), \
+                mock.patch.object(gittransfer, "prewarm_connection"), \
+                mock.patch.object(gittransfer.signal, "signal"), \
+                mock.patch.object(gittransfer.GitTransfer, "_setup_clients", return_value=True), \
+                mock.patch.object(gittransfer.GitTransfer, "transfer_repository", fake_transfer_repository):
+            return CliRunner().invoke(gittransfer.main, ["--repos-file", str(repos_file)])
+
+    failed = run(["group/alpha", "group/broken", "group/gamma"])
+    assert failed.exit_code == 1 and isinstance(failed.exception, SystemExit)
+    assert "Transfer failed" in failed.output
+    assert sorted(attempted) == ["group/alpha", "group/broken", "group/gamma"]
+
+    succeeded = run(["group/alpha", "group/gamma"])
+    assert succeeded.exit_code == 0, succeeded.output
+
+
+@pytest.mark.parametrize("option", ["--filter-blobs", "--object-cache", "--verify-clone", "--repack"])
+def test_tag_rejects_clone_options(option):
+    from click.testing import CliRunner
+
+    result = CliRunner().invoke(gittransfer.main, ["--tag", "v1.0", option])
+    assert result.exit_code == 2
+    assert f"--tag cannot be combined with {option}" in result.output
@@ -0,0 +1,100 @@
+"""Tests for the metadata transfer tool."""
+
+import importlib.util
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+# The script name has a hyphen, so it is loaded from its path
+_spec = importlib.util.spec_from_file_location(
+    "gittransfer_metadata", Path(__file__).resolve().parent.parent / "gittransfer-metadata.py")
+gittransfer_metadata = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(gittransfer_metadata)
+
+UserMapping = gittransfer_metadata.UserMapping
+
+
+def exported_author(username):
+    """An author as rebuilt from the export, without any GitHub details."""
+    return UserMapping(gitlab_username=username, gitlab_id=1, fallback_name=f"{username.title()} Name")
+
+
+def test_mapped_author_is_mentioned():
+    mappings = {"alice": UserMapping(gitlab_username="alice", gitlab_id=1, github_username="alice-gh", github_id=42)}
+    importer = gittransfer_metadata.GitHubMetadataImporter(mock.Mock(), mock.Mock(), mappings)
+    assert importer.resolve_github_username(exported_author("alice")) == "@alice-gh"
+
+
+def test_unresolved_author_is_credited_by_name():
+    mappings = {"bob": UserMapping(gitlab_username="bob", gitlab_id=2, github_username="ghost", github_id=0)}
+    importer = gittransfer_metadata.GitHubMetadataImporter(mock.Mock(), mock.Mock(), mappings)
+    assert importer.resolve_github_username(exported_author("bob")) == "Bob Name"
+
+
+def test_unknown_github_user_is_marked_after_lookup(tmp_path):
+    tool = gittransfer_metadata.MetadataTransferTool(export_dir=str(tmp_path))
+    tool.user_mappings = {
+        "alice": UserMapping(gitlab_username="alice", gitlab_id=1, github_username="alice-gh"),
+        "bob": UserMapping(gitlab_username="bob", gitlab_id=2, github_username="ghost"),
+    }
+
+    def get_user(username):
+        if username == "ghost":
+            raise gittransfer_metadata.UnknownObjectException(404, {}, {})
+        return mock.Mock(id=42)
+
+    tool.github_client = mock.Mock(**{"get_user.side_effect": get_user})
+    tool.resolve_github_user_ids()
+
+    assert tool.user_mappings["alice"].github_id == 42
+    assert tool.user_mappings["bob"].github_id == 0
+    importer = gittransfer_metadata.GitHubMetadataImporter(mock.Mock(), mock.Mock(), tool.user_mappings)
+    assert importer.resolve_github_username(exported_author("alice")) == "@alice-gh"
+    assert importer.resolve_github_username(exported_author("bob")) == "Bob Name"
+
+
+def write_export(tool, fragments):
+    """Write export fragments and their manifest the way export_metadata does."""
+    manifest = {key: tool._write_export_fragment(fragment) for key, fragment in fragments.items()}
+    gittransfer_metadata.write_json(tool.export_dir / gittransfer_metadata.EXPORT_MANIFEST_FILE, manifest)
+    return manifest
+
+
+def test_export_fragments_round_trip(tmp_path):
+    tool = gittransfer_metadata.MetadataTransferTool(export_dir=str(tmp_path))
+    author = UserMapping(gitlab_username="alice", gitlab_id=1)
+    labels = [{"name": "bug", "color": "d73a4a"}]
+    issues = [{"iid": 1, "title": "First", "author": author}, {"iid": 2, "title": "Zweite ✓", "author": author}]
+    manifest = write_export(tool, {
+        "project_info": ("project_info.json", {"gitlab_id": 7}),
+        "labels": ("labels.json", labels),
+        "issues": ("issues.jsonl", issues),
+    })
+
+    assert manifest["issues"]["count"] == 2
+    assert manifest["project_info"]["count"] == 1
+    data = tool.load_export_data()
+    assert data["project_info"] == {"gitlab_id": 7}
+    assert data["labels"] == labels
+    assert [issue["title"] for issue in data["issues"]] == ["First", "Zweite ✓"]
+    assert data["issues"][0]["author"]["gitlab_username"] == "alice"
+
+
+def test_export_checksum_mismatch_is_reported(tmp_path):
+    tool = gittransfer_metadata.MetadataTransferTool(export_dir=str(tmp_path))
+    write_export(tool, {"issues": ("issues.jsonl", [{"iid": 1}, {"iid": 2}])})
+    # Losing a line must not go unnoticed
+    path = tmp_path / "issues.jsonl"
+    path.write_bytes(path.read_bytes().splitlines(keepends=True)[0])
+
+    with pytest.raises(ValueError, match="Checksum mismatch for issues.jsonl"):
+        tool.load_export_data()
+
+
+def test_legacy_single_file_export_is_loaded(tmp_path):
+    tool = gittransfer_metadata.MetadataTransferTool(export_dir=str(tmp_path))
+    legacy = {"project_info": {"gitlab_id": 7}, "labels": [], "issues": [{"iid": 1}], "merge_requests": []}
+    gittransfer_metadata.write_json(tmp_path / gittransfer_metadata.LEGACY_EXPORT_FILE, legacy)
+
+    assert tool.load_export_data() == legacy